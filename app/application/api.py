@@ -7,6 +7,7 @@ with proper error handling, user-friendly messages, and comprehensive logging.
 
 from __future__ import annotations
 
+import contextlib
 import json
 import math
 import re
@@ -16,6 +17,7 @@ from html import unescape
 from typing import Any
 
 import pandas as pd
+from sqlalchemy import Float, case, func, or_, select, type_coerce
 from sqlalchemy.orm import Session
 
 from ..domain.schemas import (
@@ -35,8 +37,14 @@ from ..infrastructure.exceptions import (
     create_user_friendly_error_message,
     log_error_details,
 )
-from ..infrastructure.logging import get_logger, log_operation, set_context
+from ..infrastructure.logging import (
+    get_logger,
+    log_database_batch,
+    log_operation,
+    set_context,
+)
 from ..infrastructure.models import (
+    AcronymORM,
     AssessmentEntryORM,
     AssessmentSessionORM,
     DimensionORM,
@@ -49,7 +57,6 @@ from ..infrastructure.repositories import (
     SessionRepo,
     TopicRepo,
 )
-from ..utils.resilience_radar import gradient_color, make_resilience_radar_with_theme_bars
 
 logger = get_logger(__name__)
 
@@ -412,13 +419,18 @@ def compute_theme_averages(session: Session, session_id: int) -> list[AverageRes
 
 
 @log_operation("compute_dimension_averages")
-def compute_dimension_averages(session: Session, session_id: int) -> list[AverageResult]:
+def compute_dimension_averages(
+    session: Session,
+    session_id: int,
+    theme_results: list[AverageResult] | None = None,
+) -> list[AverageResult]:
     """
     Compute average scores per dimension for a session.
 
     Args:
         session: Database session
         session_id: Assessment session ID
+        theme_results: Theme averages already computed for this session (recomputed when None)
 
     Returns:
         List of dimension averages with coverage information
@@ -441,7 +453,7 @@ def compute_dimension_averages(session: Session, session_id: int) -> list[Averag
 
         # Calculate averages
         scoring_service = ScoringService(session)
-        results = scoring_service.compute_dimension_averages(session_id)
+        results = scoring_service.compute_dimension_averages(session_id, theme_results)
 
         # Guard: ensure we return AverageResult objects internally (UI expects attributes)
         from app.domain.services import AverageResult  # adjust path if needed
@@ -482,6 +494,8 @@ def compute_dimension_averages(session: Session, session_id: int) -> list[Averag
 @log_operation("build_dashboard_figures")
 def build_dashboard_figures(session: Session, session_id: int) -> dict[str, Any]:
     """Create Plotly-ready dashboard payload (dimension tiles + radar figure)."""
+    # Plotly is only needed here; importing it lazily keeps it off the app's startup path.
+    from ..utils.resilience_radar import gradient_color, make_resilience_radar_with_theme_bars
 
     try:
         set_context(operation="build_dashboard_figures", session_id=session_id)
@@ -509,60 +523,61 @@ def build_dashboard_figures(session: Session, session_id: int) -> dict[str, Any]
                 }
             )
 
-        # Radar figure requires score rows per topic
+        # Radar figure requires score rows per topic, shaped by a single joined query
         radar_json: dict[str, Any] | None = None
-        topics_df = list_dimensions_with_topics(session)
-        entries = (
-            session.query(AssessmentEntryORM)
-            .filter(AssessmentEntryORM.session_id == session_id)
-            .all()
+        # Typed as Float so drivers hand back plain numbers rather than per-row Decimals
+        score_expr = type_coerce(
+            case(
+                (
+                    AssessmentEntryORM.current_is_na.is_(False),
+                    func.coalesce(
+                        AssessmentEntryORM.computed_score, AssessmentEntryORM.current_maturity
+                    ),
+                ),
+                else_=None,
+            ),
+            Float,
         )
+        target_expr = type_coerce(
+            case(
+                (AssessmentEntryORM.desired_is_na.is_(False), AssessmentEntryORM.desired_maturity),
+                else_=None,
+            ),
+            Float,
+        )
+        rows = session.execute(
+            select(
+                DimensionORM.name,
+                ThemeORM.name,
+                TopicORM.name,
+                score_expr,
+                target_expr,
+            )
+            .join(ThemeORM, ThemeORM.dimension_id == DimensionORM.id)
+            .join(TopicORM, TopicORM.theme_id == ThemeORM.id)
+            .join(
+                AssessmentEntryORM,
+                (AssessmentEntryORM.topic_id == TopicORM.id)
+                & (AssessmentEntryORM.session_id == session_id),
+            )
+            .where(or_(score_expr.isnot(None), target_expr.isnot(None)))
+            .order_by(DimensionORM.name, ThemeORM.name, TopicORM.name)
+        ).all()
 
-        ratings_map: dict[int, float] = {}
-        target_map: dict[int, float] = {}
-        for entry in entries:
-            if not entry.current_is_na:
-                if entry.computed_score is not None:
-                    ratings_map[entry.topic_id] = float(entry.computed_score)
-                elif entry.current_maturity is not None:
-                    ratings_map[entry.topic_id] = float(entry.current_maturity)
-            if not entry.desired_is_na and entry.desired_maturity is not None:
-                target_map[entry.topic_id] = float(entry.desired_maturity)
-
-        score_rows: list[dict[str, Any]] = []
-        target_rows: list[dict[str, Any]] = []
-        for _, row in topics_df.iterrows():
-            topic_id = int(row["TopicID"])
-            score = ratings_map.get(topic_id)
-            if score is None:
-                pass
-            else:
-                score_rows.append(
-                    {
-                        "Dimension": row["Dimension"],
-                        "Theme": row["Theme"],
-                        "Question": row["Topic"],
-                        "Score": score,
-                    }
-                )
-            target = target_map.get(topic_id)
-            if target is not None:
-                target_rows.append(
-                    {
-                        "Dimension": row["Dimension"],
-                        "Theme": row["Theme"],
-                        "Question": row["Topic"],
-                        "Score": target,
-                    }
-                )
+        columns = ["Dimension", "Theme", "Question", "Score"]
+        radar_df = pd.DataFrame(rows, columns=[*columns, "Target"]).astype(
+            {"Score": "float64", "Target": "float64"}
+        )
+        scores_df = radar_df.dropna(subset=["Score"])[columns]
 
-        if score_rows:
-            scores_df = pd.DataFrame(score_rows, columns=["Dimension", "Theme", "Question", "Score"])
+        if not scores_df.empty:
             target_df = (
-                pd.DataFrame(target_rows, columns=["Dimension", "Theme", "Question", "Score"])
-                if target_rows
-                else None
+                radar_df.dropna(subset=["Target"])
+                .drop(columns="Score")
+                .rename(columns={"Target": "Score"})
             )
+            if target_df.empty:
+                target_df = None
             figure = make_resilience_radar_with_theme_bars(scores_df, target_scores=target_df)
             radar_json = json.loads(figure.to_json())
 
@@ -583,13 +598,18 @@ def build_dashboard_figures(session: Session, session_id: int) -> dict[str, Any]
 
 
 @log_operation("export_session_results")
-def export_session_results(session: Session, session_id: int) -> tuple[pd.DataFrame, pd.DataFrame]:
+def export_session_results(
+    session: Session,
+    session_id: int,
+    topics_df: pd.DataFrame | None = None,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
     """
     Export session results as DataFrames for download/analysis.
 
     Args:
         session: Database session
         session_id: Assessment session ID
+        topics_df: Pre-fetched topic catalog (queried when None)
 
     Returns:
         Tuple of (topics_df, entries_df) DataFrames
@@ -610,12 +630,13 @@ def export_session_results(session: Session, session_id: int) -> tuple[pd.DataFr
         session_repo = SessionRepo(session)
         session_repo.get_by_id_required(session_id)
 
-        # Get topics structure
-        topics_df = list_dimensions_with_topics(session)
+        # Get topics structure (callers may pass a cached catalog)
+        if topics_df is None:
+            topics_df = list_dimensions_with_topics(session)
 
-        # Get session entries
+        # Stream session entries straight into row dicts
         entry_repo = EntryRepo(session)
-        entries = entry_repo.list_for_session(session_id)
+        entries = entry_repo.iter_for_session(session_id)
 
         # Convert entries to DataFrame
         entry_rows = []
@@ -703,6 +724,8 @@ def import_session_results(
         records = dataframe.to_dict(orient="records")
         validation_errors: list[ValidationError] = []
         processed = 0
+        # Rows repeating a topic collapse onto one entry; the last row wins
+        entry_rows: dict[tuple[int, int], dict[str, Any]] = {}
 
         def _is_missing(value: Any) -> bool:
             if value is None or value is pd.NA:
@@ -720,156 +743,161 @@ def import_session_results(
                 return value.strip().lower() in {"1", "true", "yes", "y"}
             return bool(value)
 
-        for index, row in enumerate(records, start=2):
-            topic_id_raw = row.get("TopicID")
-            if _is_missing(topic_id_raw):
-                continue
+        # Resolve every referenced topic in one IN query; only unknown ids fall back to a lookup
+        candidate_ids: set[int] = set()
+        for row in records:
+            if not _is_missing(row.get("TopicID")):
+                with contextlib.suppress(TypeError, ValueError):
+                    candidate_ids.add(int(row["TopicID"]))
+        known_topics = topic_repo.get_many_by_ids(candidate_ids)
 
-            try:
-                topic_id = int(topic_id_raw)
-                topic_repo.get_by_id_required(topic_id)
-            except (ValueError, TopicNotFoundError, ValidationError) as exc:
-                validation_errors.append(
-                    ValidationError(
-                        "TopicID",
-                        f"Invalid topic reference at row {index}",
-                        value=topic_id_raw,
-                        details={"row": index, "error": str(exc)},
-                    )
-                )
-                continue
-
-            current_raw = row.get("CurrentMaturity", row.get("Rating"))
-            desired_raw = row.get("DesiredMaturity", current_raw)
-            current_maturity: int | None
-            desired_maturity: int | None
+        with log_database_batch("import_entries", count=len(records)):
+            for index, row in enumerate(records, start=2):
+                topic_id_raw = row.get("TopicID")
+                if _is_missing(topic_id_raw):
+                    continue
 
-            if _is_missing(current_raw):
-                current_maturity = None
-            else:
                 try:
-                    current_maturity = int(float(current_raw))
-                except (TypeError, ValueError):
+                    topic_id = int(topic_id_raw)
+                    if topic_id not in known_topics:
+                        topic_repo.get_by_id_required(topic_id, log=False)
+                except (ValueError, TopicNotFoundError, ValidationError) as exc:
                     validation_errors.append(
                         ValidationError(
-                            "CurrentMaturity",
-                            f"Invalid current maturity at row {index}",
-                            value=current_raw,
-                            details={"row": index},
+                            "TopicID",
+                            f"Invalid topic reference at row {index}",
+                            value=topic_id_raw,
+                            details={"row": index, "error": str(exc)},
                         )
                     )
                     continue
 
-            if _is_missing(desired_raw):
-                desired_maturity = None
-            else:
-                try:
-                    desired_maturity = int(float(desired_raw))
-                except (TypeError, ValueError):
-                    validation_errors.append(
-                        ValidationError(
-                            "DesiredMaturity",
-                            f"Invalid desired maturity at row {index}",
-                            value=desired_raw,
-                            details={"row": index},
+                current_raw = row.get("CurrentMaturity", row.get("Rating"))
+                desired_raw = row.get("DesiredMaturity", current_raw)
+                current_maturity: int | None
+                desired_maturity: int | None
+
+                if _is_missing(current_raw):
+                    current_maturity = None
+                else:
+                    try:
+                        current_maturity = int(float(current_raw))
+                    except (TypeError, ValueError):
+                        validation_errors.append(
+                            ValidationError(
+                                "CurrentMaturity",
+                                f"Invalid current maturity at row {index}",
+                                value=current_raw,
+                                details={"row": index},
+                            )
                         )
-                    )
-                    continue
+                        continue
 
-            computed_raw = row.get("ComputedScore")
-            if _is_missing(computed_raw):
-                computed_score = None
-            else:
-                try:
-                    computed_score = Decimal(str(computed_raw))
-                except (ValueError, ArithmeticError):
-                    validation_errors.append(
-                        ValidationError(
-                            "ComputedScore",
-                            f"Invalid computed score at row {index}",
-                            value=computed_raw,
-                            details={"row": index},
+                if _is_missing(desired_raw):
+                    desired_maturity = None
+                else:
+                    try:
+                        desired_maturity = int(float(desired_raw))
+                    except (TypeError, ValueError):
+                        validation_errors.append(
+                            ValidationError(
+                                "DesiredMaturity",
+                                f"Invalid desired maturity at row {index}",
+                                value=desired_raw,
+                                details={"row": index},
+                            )
                         )
-                    )
-                    continue
+                        continue
 
-            current_is_na = _coerce_bool(row.get("CurrentNA", row.get("N/A")))
-            desired_is_na = _coerce_bool(row.get("DesiredNA", row.get("N/A")))
+                computed_raw = row.get("ComputedScore")
+                if _is_missing(computed_raw):
+                    computed_score = None
+                else:
+                    try:
+                        computed_score = Decimal(str(computed_raw))
+                    except (ValueError, ArithmeticError):
+                        validation_errors.append(
+                            ValidationError(
+                                "ComputedScore",
+                                f"Invalid computed score at row {index}",
+                                value=computed_raw,
+                                details={"row": index},
+                            )
+                        )
+                        continue
 
-            comment_raw = row.get("Comment")
-            comment = None if _is_missing(comment_raw) else str(comment_raw).strip()
+                current_is_na = _coerce_bool(row.get("CurrentNA", row.get("N/A")))
+                desired_is_na = _coerce_bool(row.get("DesiredNA", row.get("N/A")))
 
-            evidence_links: list[str] | None = None
-            evidence_raw = row.get("EvidenceLinks")
-            if not _is_missing(evidence_raw):
-                if isinstance(evidence_raw, list):
-                    evidence_links = [str(item).strip() for item in evidence_raw if str(item).strip()]
-                    if not evidence_links:
-                        evidence_links = None
-                elif isinstance(evidence_raw, str):
-                    try:
-                        parsed = json.loads(evidence_raw)
-                        if isinstance(parsed, list):
+                comment_raw = row.get("Comment")
+                comment = None if _is_missing(comment_raw) else str(comment_raw).strip()
+
+                evidence_links: list[str] | None = None
+                evidence_raw = row.get("EvidenceLinks")
+                if not _is_missing(evidence_raw):
+                    if isinstance(evidence_raw, list):
+                        evidence_links = [
+                            str(item).strip() for item in evidence_raw if str(item).strip()
+                        ]
+                        if not evidence_links:
+                            evidence_links = None
+                    elif isinstance(evidence_raw, str):
+                        try:
+                            parsed = json.loads(evidence_raw)
+                            if isinstance(parsed, list):
+                                evidence_links = [
+                                    str(item).strip() for item in parsed if str(item).strip()
+                                ] or None
+                            elif parsed is not None:
+                                evidence_links = [str(parsed).strip()]
+                        except json.JSONDecodeError:
                             evidence_links = [
-                                str(item).strip() for item in parsed if str(item).strip()
+                                part.strip()
+                                for part in re.split(r"[\n,]+", evidence_raw)
+                                if part and part.strip()
                             ] or None
-                        elif parsed is not None:
-                            evidence_links = [str(parsed).strip()]
-                    except json.JSONDecodeError:
-                        evidence_links = [
-                            part.strip()
-                            for part in re.split(r"[\n,]+", evidence_raw)
-                            if part and part.strip()
-                        ] or None
 
-            progress_state_raw = row.get("ProgressState")
-            if isinstance(progress_state_raw, str) and progress_state_raw.strip():
-                progress_state = progress_state_raw.strip().lower()
-            else:
-                progress_state = "not_started"
-            if progress_state not in {"not_started", "in_progress", "complete"}:
-                progress_state = "not_started"
+                progress_state_raw = row.get("ProgressState")
+                if isinstance(progress_state_raw, str) and progress_state_raw.strip():
+                    progress_state = progress_state_raw.strip().lower()
+                else:
+                    progress_state = "not_started"
+                if progress_state not in {"not_started", "in_progress", "complete"}:
+                    progress_state = "not_started"
 
-            if not any(
-                [
-                    current_maturity is not None,
-                    desired_maturity is not None,
-                    current_is_na,
-                    desired_is_na,
-                    comment,
-                    evidence_links,
-                    computed_score is not None,
-                ]
-            ):
-                continue
+                if not any(
+                    [
+                        current_maturity is not None,
+                        desired_maturity is not None,
+                        current_is_na,
+                        desired_is_na,
+                        comment,
+                        evidence_links,
+                        computed_score is not None,
+                    ]
+                ):
+                    continue
 
-            try:
-                entry_repo.upsert(
-                    session_id=session_id,
-                    topic_id=topic_id,
-                    current_maturity=current_maturity,
-                    desired_maturity=desired_maturity,
-                    computed_score=computed_score,
-                    current_is_na=current_is_na,
-                    desired_is_na=desired_is_na,
-                    comment=comment,
-                    evidence_links=evidence_links,
-                    progress_state=progress_state,
-                )
+                entry_rows[(session_id, topic_id)] = {
+                    "session_id": session_id,
+                    "topic_id": topic_id,
+                    "current_maturity": current_maturity,
+                    "desired_maturity": desired_maturity,
+                    "computed_score": computed_score,
+                    "current_is_na": current_is_na,
+                    "desired_is_na": desired_is_na,
+                    "comment": comment,
+                    "evidence_links": evidence_links,
+                    "progress_state": progress_state,
+                }
                 processed += 1
-            except ValidationError as exc:
-                validation_errors.append(
-                    ValidationError(
-                        exc.field,
-                        f"Row {index}: {exc.message}",
-                        value=exc.value,
-                        details={"row": index, **exc.details},
-                    )
-                )
 
         if validation_errors:
             raise MultipleValidationError(validation_errors)
 
+        # One validated INSERT ... ON CONFLICT for the whole sheet
+        entry_repo.bulk_upsert(entry_rows.values())
+
         logger.info("Imported %s entries for session %s", processed, session_id)
         return processed
 
@@ -946,10 +974,18 @@ def combine_sessions_to_master(
             operation="combine_sessions", source_sessions=source_session_ids, master_name=name
         )
 
-        # Verify all source sessions exist
+        # Verify all source sessions exist: one id lookup, per-id fetch only to raise for a miss
         session_repo = SessionRepo(session)
+        known_ids = set(
+            session.scalars(
+                select(AssessmentSessionORM.id).where(
+                    AssessmentSessionORM.id.in_(source_session_ids)
+                )
+            )
+        )
         for sid in source_session_ids:
-            session_repo.get_by_id_required(sid)
+            if sid not in known_ids:
+                session_repo.get_by_id_required(sid)
 
         # Create master session
         master = create_assessment_session(
@@ -973,26 +1009,29 @@ def combine_sessions_to_master(
 
         by_topic: dict[int, list[float]] = defaultdict(list)
 
+        # Single pass over every source session's rated rows (N/A entries are filtered in SQL)
         entry_repo = EntryRepo(session)
-        for session_id in source_session_ids:
-            entries = entry_repo.list_for_session(session_id)
-            for entry in entries:
-                if entry.current_is_na:
-                    continue
-
-                # Use computed_score if available, otherwise current maturity
-                value = (
-                    entry.computed_score
-                    if entry.computed_score is not None
-                    else entry.current_maturity
-                )
-                if value is not None:
-                    by_topic[entry.topic_id].append(float(value))
+        source_rows = session.execute(
+            select(
+                AssessmentEntryORM.topic_id,
+                AssessmentEntryORM.computed_score,
+                AssessmentEntryORM.current_maturity,
+            ).where(
+                AssessmentEntryORM.session_id.in_(source_session_ids),
+                ~AssessmentEntryORM.current_is_na,
+            )
+        )
+        for topic_id, computed_score, current_maturity in source_rows:
+            # Use computed_score if available, otherwise current maturity
+            value = computed_score if computed_score is not None else current_maturity
+            if value is not None:
+                by_topic[topic_id].append(float(value))
 
         # Create master entries
         entries_created = 0
         entries_na = 0
 
+        master_rows: list[dict[str, Any]] = []
         for topic in all_topics:
             values = by_topic.get(topic.id, [])
 
@@ -1002,39 +1041,44 @@ def combine_sessions_to_master(
 
                 rounded = max(1, min(5, int(round(average_score))))
 
-                entry_repo.upsert(
-                    session_id=master.id,
-                    topic_id=topic.id,
-                    current_maturity=rounded,
-                    desired_maturity=rounded,
-                    computed_score=Decimal(str(round(average_score, 2))),
-                    current_is_na=False,
-                    desired_is_na=False,
-                    comment=(
-                        f"Combined from {len(values)} ratings across "
-                        f"{len(source_session_ids)} sessions"
-                    ),
-                    evidence_links=None,
-                    progress_state="complete",
+                master_rows.append(
+                    {
+                        "session_id": master.id,
+                        "topic_id": topic.id,
+                        "current_maturity": rounded,
+                        "desired_maturity": rounded,
+                        "computed_score": Decimal(str(round(average_score, 2))),
+                        "current_is_na": False,
+                        "desired_is_na": False,
+                        "comment": (
+                            f"Combined from {len(values)} ratings across "
+                            f"{len(source_session_ids)} sessions"
+                        ),
+                        "evidence_links": None,
+                        "progress_state": "complete",
+                    }
                 )
                 entries_created += 1
             else:
                 # No ratings for this topic across any source session
-                entry_repo.upsert(
-                    session_id=master.id,
-                    topic_id=topic.id,
-                    current_maturity=None,
-                    desired_maturity=None,
-                    computed_score=None,
-                    current_is_na=True,
-                    desired_is_na=True,
-                    comment="No ratings available in source sessions",
-                    evidence_links=None,
-                    progress_state="not_started",
+                master_rows.append(
+                    {
+                        "session_id": master.id,
+                        "topic_id": topic.id,
+                        "current_maturity": None,
+                        "desired_maturity": None,
+                        "computed_score": None,
+                        "current_is_na": True,
+                        "desired_is_na": True,
+                        "comment": "No ratings available in source sessions",
+                        "evidence_links": None,
+                        "progress_state": "not_started",
+                    }
                 )
                 entries_na += 1
 
-        session.flush()
+        # One validator pass and one flush for the whole master session
+        entry_repo.bulk_upsert(master_rows)
 
         logger.info(
             f"Combined {len(source_session_ids)} sessions into master session {master.id}: "
@@ -1086,19 +1130,27 @@ def get_session_summary(session: Session, session_id: int) -> dict[str, Any]:
         session_repo = SessionRepo(session)
         session_obj = session_repo.get_by_id_required(session_id)
 
-        # Get entries
-        entry_repo = EntryRepo(session)
-        entries = entry_repo.list_for_session(session_id)
+        # Entry statistics as plain counts; no entry objects are loaded for a summary
+        total_entries, rated_entries, na_entries, computed_entries = session.execute(
+            select(
+                func.count(),
+                func.count(
+                    case(
+                        (
+                            ~AssessmentEntryORM.current_is_na
+                            & AssessmentEntryORM.current_maturity.is_not(None),
+                            1,
+                        )
+                    )
+                ),
+                func.count(case((AssessmentEntryORM.current_is_na, 1))),
+                func.count(AssessmentEntryORM.computed_score),
+            ).where(AssessmentEntryORM.session_id == session_id)
+        ).one()
 
         # Get total topics count
         topic_repo = TopicRepo(session)
-        total_topics = len(topic_repo.list_all())
-
-        # Calculate statistics
-        total_entries = len(entries)
-        rated_entries = len([e for e in entries if not e.current_is_na and e.current_maturity is not None])
-        na_entries = len([e for e in entries if e.current_is_na])
-        computed_entries = len([e for e in entries if e.computed_score is not None])
+        total_topics = topic_repo.count()
 
         completion_percent = (total_entries / total_topics * 100) if total_topics > 0 else 0
         rating_percent = (rated_entries / total_entries * 100) if total_entries > 0 else 0
@@ -1151,14 +1203,12 @@ def list_acronyms(session: Session) -> list[dict[str, str | None]]:
         List of dictionaries describing each acronym
     """
     repo = AcronymRepo(session)
-    acronyms = repo.list_all()
-    return [
-        {
-            "id": item.id,
-            "acronym": item.acronym,
-            "full_term": item.full_term,
-            "meaning": item.meaning,
-        }
-        for item in acronyms
-    ]
+    rows = repo.list_rows(
+        AcronymORM.id,
+        AcronymORM.acronym,
+        AcronymORM.full_term,
+        AcronymORM.meaning,
+        order_by=[AcronymORM.acronym.asc()],
+    )
+    return [row._asdict() for row in rows]
 
@@ -135,17 +135,21 @@ class ScoringService:
             )
             raise
 
-    def compute_dimension_averages(self, session_id: int) -> list[AverageResult]:
+    def compute_dimension_averages(
+        self, session_id: int, theme_results: list[AverageResult] | None = None
+    ) -> list[AverageResult]:
         """
         Per-dimension average/coverage from per-theme aggregates.
         - Dimension average = mean(theme.average) excluding NaNs.
         - Dimension coverage = mean(theme.coverage) (equal-weighted across themes).
         - If a dimension has no themes: avg=NaN, coverage=0.0
+        - Pass theme_results when the caller already has them to skip re-aggregating.
         """
 
         try:
             # Get per-theme aggregates once
-            theme_results = self.compute_theme_averages(session_id)
+            if theme_results is None:
+                theme_results = self.compute_theme_averages(session_id)
 
             # Map theme -> dimension id from the DB (small query)
             theme_dim_pairs = self.s.query(ThemeORM.id, ThemeORM.dimension_id).all()
@@ -25,6 +25,30 @@ except ImportError:
 from functools import lru_cache
 
 
+@lru_cache(maxsize=8)
+def _build_connection_url(
+    backend: str,
+    sqlite_path: str | None,
+    mysql_host: str | None,
+    mysql_port: int | None,
+    mysql_user: str | None,
+    mysql_password: str | None,
+    mysql_database: str | None,
+    mysql_charset: str,
+) -> str:
+    """Assemble the connection URL (memoized: configs are rebuilt far more often than changed)."""
+    if backend == "sqlite":
+        return f"sqlite:///{sqlite_path}"
+    elif backend == "mysql":
+        password_part = f":{mysql_password}" if mysql_password else ""
+        return (
+            f"mysql+pymysql://{mysql_user}{password_part}@{mysql_host}:"
+            f"{mysql_port}/{mysql_database}?charset={mysql_charset}"
+        )
+    else:
+        raise ValueError(f"Unsupported database backend: {backend}")
+
+
 class DatabaseConfig(BaseSettings):
     """
     Database configuration settings.
@@ -66,6 +90,8 @@ class DatabaseConfig(BaseSettings):
     # Connection settings
     pool_pre_ping: bool = Field(True, description="Enable connection pool pre-ping")
     pool_recycle: int = Field(3600, ge=60, description="Connection pool recycle time (seconds)")
+    pool_size: int = Field(5, ge=1, description="Persistent connections kept by the pool (MySQL)")
+    max_overflow: int = Field(10, ge=0, description="Extra connections allowed under load (MySQL)")
     echo: bool = Field(False, description="Enable SQL query logging")
 
     model_config = {"env_prefix": "DB_", "case_sensitive": False}
@@ -106,16 +132,16 @@ class DatabaseConfig(BaseSettings):
         Raises:
             ValueError: If backend is unsupported or configuration is invalid
         """
-        if self.backend == "sqlite":
-            return f"sqlite:///{self.sqlite_path}"
-        elif self.backend == "mysql":
-            password_part = f":{self.mysql_password}" if self.mysql_password else ""
-            return (
-                f"mysql+pymysql://{self.mysql_user}{password_part}@{self.mysql_host}:"
-                f"{self.mysql_port}/{self.mysql_database}?charset={self.mysql_charset}"
-            )
-        else:
-            raise ValueError(f"Unsupported database backend: {self.backend}")
+        return _build_connection_url(
+            self.backend,
+            self.sqlite_path,
+            self.mysql_host,
+            self.mysql_port,
+            self.mysql_user,
+            self.mysql_password,
+            self.mysql_database,
+            self.mysql_charset,
+        )
 
     def get_engine_options(self) -> dict[str, Any]:
         """
@@ -124,12 +150,21 @@ class DatabaseConfig(BaseSettings):
         Returns:
             Dictionary of engine configuration options
         """
-        return {
+        options: dict[str, Any] = {
             "echo": self.echo,
             "future": True,
             "pool_pre_ping": self.pool_pre_ping,
             "pool_recycle": self.pool_recycle,
         }
+        if self.backend != "sqlite":
+            # LIFO checkout keeps a small hot set of connections busy and lets idle
+            # overflow connections age out; SQLite uses its own file/thread pools.
+            options.update(
+                pool_use_lifo=True,
+                pool_size=self.pool_size,
+                max_overflow=self.max_overflow,
+            )
+        return options
 
 
 class LoggingConfig(BaseSettings):
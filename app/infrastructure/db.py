@@ -7,8 +7,11 @@ system, with proper error handling and logging integration.
 
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
+
 from sqlalchemy import create_engine
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.orm import Session, sessionmaker
 
 from .config import DatabaseConfig, get_settings
@@ -78,6 +81,35 @@ def create_session_factory(engine: Engine | None = None) -> sessionmaker[Session
     return SessionLocal
 
 
+_ENGINE_CACHE_SIZE = 8
+_engines: OrderedDict[str, Engine] = OrderedDict()
+_engines_lock = threading.Lock()
+
+
+def _engine_for_url(connection_url: str) -> Engine:
+    """
+    Shared engine per URL so repeated legacy calls keep one warm connection pool.
+
+    The least recently used engine is disposed when the cache is full, so its
+    pooled connections are closed rather than left open until process exit.
+    """
+    with _engines_lock:
+        engine = _engines.get(connection_url)
+        if engine is not None:
+            _engines.move_to_end(connection_url)
+            return engine
+
+        options: dict[str, object] = {"echo": False, "future": True, "pool_pre_ping": True}
+        if make_url(connection_url).get_backend_name() != "sqlite":
+            options.update(pool_use_lifo=True, pool_size=5, max_overflow=10, pool_recycle=1800)
+        engine = create_engine(connection_url, **options)
+        _engines[connection_url] = engine
+        if len(_engines) > _ENGINE_CACHE_SIZE:
+            _, evicted = _engines.popitem(last=False)
+            evicted.dispose()
+        return engine
+
+
 def make_engine_and_session(
     connection_url: str | None = None,
 ) -> tuple[Engine, sessionmaker[Session]]:
@@ -99,7 +131,7 @@ def make_engine_and_session(
     if connection_url:
         # Legacy mode: create engine from URL
         logger.info("Using legacy connection URL mode")
-        engine = create_engine(connection_url, echo=False, future=True, pool_pre_ping=True)
+        engine = _engine_for_url(connection_url)
         SessionLocal: sessionmaker[Session] = sessionmaker(
             bind=engine, autoflush=False, autocommit=False, expire_on_commit=False, future=True
         )
@@ -9,6 +9,8 @@ from __future__ import annotations
 
 from typing import Any
 
+from sqlalchemy import exc as sa_exc
+
 
 class ResilienceAssessmentError(Exception):
     """Base exception for all application errors."""
@@ -300,18 +302,24 @@ def handle_database_error(e: Exception, operation: str = "database operation") -
         >>> except Exception as e:
         ...     raise handle_database_error(e, "commit transaction")
     """
-    error_msg = str(e).lower()
+    message = str(e)
+    if isinstance(e, (sa_exc.DisconnectionError, sa_exc.TimeoutError)):
+        return ConnectionError(message)
+
+    # Probe the short DBAPI message rather than the wrapper text, which also echoes the statement
+    orig = e.orig if isinstance(e, sa_exc.DBAPIError) else None
+    error_msg = (message if orig is None else str(orig)).lower()
 
     if "connection" in error_msg or "timeout" in error_msg:
-        return ConnectionError(str(e))
+        return ConnectionError(message)
     elif "unique constraint" in error_msg or "duplicate" in error_msg:
-        return IntegrityError(str(e), constraint="unique")
+        return IntegrityError(message, constraint="unique")
     elif "foreign key" in error_msg or "foreign_key" in error_msg:
-        return IntegrityError(str(e), constraint="foreign_key")
+        return IntegrityError(message, constraint="foreign_key")
     elif "check constraint" in error_msg:
-        return IntegrityError(str(e), constraint="check")
+        return IntegrityError(message, constraint="check")
     else:
-        return DatabaseError(str(e), operation)
+        return DatabaseError(message, operation)
 
 
 def create_user_friendly_error_message(error: Exception) -> str:
@@ -11,7 +11,8 @@ import json
 import logging
 import logging.config
 import os
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from datetime import datetime
 from functools import wraps
 from pathlib import Path
@@ -313,6 +314,42 @@ def log_database_operation(operation: str) -> Callable[[Callable[P, R]], Callabl
     return decorator
 
 
+@contextmanager
+def log_database_batch(operation: str, count: int | None = None) -> Iterator[None]:
+    """
+    Log a batch of database work once, instead of once per row.
+
+    Per-row repository calls made with ``log=False`` run inside this context so
+    the start/finish records and timing are paid per batch.
+
+    Args:
+        operation: Description of the batch operation
+        count: Number of rows in the batch, if known
+
+    Example:
+        >>> with log_database_batch("import_entries", count=len(rows)):
+        ...     for row in rows:
+        ...         repo.upsert(**row, flush=False, log=False)
+    """
+    logger = get_logger("database")
+    suffix = f" ({count} rows)" if count is not None else ""
+
+    with LogContext(operation=f"db_{operation}", count=count):
+        logger.info(f"Starting database batch: {operation}{suffix}")
+        start_time = datetime.utcnow()
+        try:
+            yield
+        except Exception as e:
+            duration = (datetime.utcnow() - start_time).total_seconds()
+            logger.error(
+                f"Database batch {operation}{suffix} failed after {duration:.3f}s: {str(e)}",
+                exc_info=True,
+            )
+            raise
+        duration = (datetime.utcnow() - start_time).total_seconds()
+        logger.info(f"Database batch {operation}{suffix} completed in {duration:.3f}s")
+
+
 def configure_development_logging():
     """Configure logging for development environment."""
     setup_logging(
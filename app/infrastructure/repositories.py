@@ -11,8 +11,10 @@ This module provides data access layer implementations with:
 
 from __future__ import annotations
 
-from typing import NoReturn
+from collections.abc import Iterable
+from typing import Any, NoReturn
 
+from sqlalchemy import insert, select
 from sqlalchemy.exc import IntegrityError as SQLIntegrityError, SQLAlchemyError
 from sqlalchemy.orm import Session
 
@@ -22,7 +24,10 @@ from .exceptions import (
 )
 from .logging import get_logger, log_database_operation
 from .models import (
+    DimensionORM,
     ExplanationORM,
+    ThemeORM,
+    TopicORM,
 )
 from .repositories_dimension import DimensionRepo  # re-export
 from .repositories_entry import EntryRepo
@@ -131,6 +136,31 @@ class ExplanationRepo(BaseRepository):
         except SQLAlchemyError as e:
             self._handle_error(e, "create_explanation")
 
+    @log_database_operation("create_explanations")
+    def create_many(self, rows: Iterable[dict[str, Any]]) -> int:
+        """
+        Create many explanations with one executemany INSERT.
+
+        Args:
+            rows: Mappings with topic_id, level and text
+
+        Returns:
+            Number of explanations inserted
+        """
+        from ..domain.schemas import ExplanationInput
+
+        values = [ExplanationInput(**row).model_dump() for row in rows]
+        if not values:
+            return 0
+
+        try:
+            self.session.execute(insert(ExplanationORM), values)
+            return len(values)
+        except SQLIntegrityError as e:
+            self._handle_error(e, "create_explanations")
+        except SQLAlchemyError as e:
+            self._handle_error(e, "create_explanations")
+
     @log_database_operation("list_explanations_for_topic")
     def list_for_topic(self, topic_id: int) -> list[ExplanationORM]:
         """
@@ -146,11 +176,39 @@ class ExplanationRepo(BaseRepository):
             raise ValidationError("topic_id", "Topic ID must be positive")
 
         try:
-            return (
-                self.session.query(ExplanationORM)
-                .filter_by(topic_id=topic_id)
-                .order_by(ExplanationORM.level, ExplanationORM.id)
-                .all()
+            return list(
+                self.session.scalars(
+                    select(ExplanationORM)
+                    .where(ExplanationORM.topic_id == topic_id)
+                    .order_by(ExplanationORM.level, ExplanationORM.id)
+                ).all()
             )
         except SQLAlchemyError as e:
             self._handle_error(e, "list_explanations_for_topic")
+
+    @log_database_operation("list_all_explanations")
+    def list_all(self) -> list[ExplanationORM]:
+        """
+        Get explanations for every topic in one query.
+
+        Returns:
+            List of ExplanationORM instances in topic order, then by level
+        """
+        try:
+            return list(
+                self.session.scalars(
+                    select(ExplanationORM)
+                    .join(TopicORM)
+                    .join(ThemeORM)
+                    .join(DimensionORM)
+                    .order_by(
+                        DimensionORM.name,
+                        ThemeORM.name,
+                        TopicORM.name,
+                        ExplanationORM.level,
+                        ExplanationORM.id,
+                    )
+                ).all()
+            )
+        except SQLAlchemyError as e:
+            self._handle_error(e, "list_all_explanations")
@@ -25,3 +25,10 @@ class AcronymRepo(GenericBaseRepository[AcronymORM]):
         if order_by is None and hasattr(self.model, "acronym"):
             order_by = [self.model.acronym.asc()]
         return super().list(order_by=order_by)
+
+    @log_op("acronym.create_many")
+    def create_many(self, rows: Iterable[dict[str, Any]]) -> list[int]:
+        """
+        Insert many acronyms in one batched INSERT, returning their ids in input order.
+        """
+        return self.insert_many(list(rows))
@@ -2,10 +2,20 @@
 from __future__ import annotations
 
 import builtins
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from typing import Any, TypeVar, Generic
 
-from sqlalchemy.orm import Session
+from sqlalchemy import (
+    Executable,
+    Select,
+    exists as sa_exists,
+    func,
+    insert,
+    inspect as sa_inspect,
+    select,
+)
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Bundle, Session, load_only
 
 T = TypeVar("T")  # ORM model type
 
@@ -40,18 +50,20 @@ class BaseRepository(Generic[T]):
         order_by: Iterable[Any] | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        only_fields: Iterable[Any] | None = None,
     ) -> builtins.list[T]:
-        q = self.s.query(self.model)
-        for f in filters:
-            q = q.filter(f)
+        stmt = select(self.model)
+        if only_fields:
+            stmt = stmt.options(load_only(*only_fields))
+        if filters:
+            stmt = stmt.where(*filters)
         if order_by:
-            for ob in order_by:
-                q = q.order_by(ob)
+            stmt = stmt.order_by(*order_by)
         if offset:
-            q = q.offset(offset)
+            stmt = stmt.offset(offset)
         if limit:
-            q = q.limit(limit)
-        return list(q.all())
+            stmt = stmt.limit(limit)
+        return list(self.s.scalars(stmt).all())
 
     def list_all(
         self,
@@ -60,32 +72,161 @@ class BaseRepository(Generic[T]):
         """Backward-compatible alias for code that expects `list_all()`."""
         return self.list(order_by=order_by)
 
+    def list_columns(
+        self,
+        *cols: Any,
+        order_by: Iterable[Any] | None = None,
+        limit: int | None = None,
+    ) -> builtins.list[Row[Any]]:
+        """
+        Fetch only the given columns as row tuples (no ORM objects are built).
+        """
+        stmt = select(*cols).select_from(self.model)
+        if order_by:
+            stmt = stmt.order_by(*order_by)
+        if limit:
+            stmt = stmt.limit(limit)
+        return builtins.list(self.s.execute(stmt).all())
+
+    def list_rows(
+        self,
+        *cols: Any,
+        order_by: Iterable[Any] | None = None,
+    ) -> builtins.list[Any]:
+        """
+        Fetch the given columns as lightweight named rows (``row.name`` access).
+        Rows bypass the identity map and attribute instrumentation; use for read-only views.
+        """
+        stmt: Select[Any] = select(Bundle("row", *cols)).select_from(self.model)
+        if order_by:
+            stmt = stmt.order_by(*order_by)
+        return builtins.list(self.s.execute(stmt).scalars())
+
+    def iter(
+        self,
+        *filters: Any,
+        order_by: Iterable[Any] | None = None,
+        page: int = 1000,
+    ) -> Iterator[T]:
+        """
+        Stream matching rows in pages of `page` objects (server-side cursor where supported).
+        The statement executes immediately; rows are fetched as the iterator is consumed.
+        """
+        stmt = select(self.model).where(*filters)
+        if order_by:
+            stmt = stmt.order_by(*order_by)
+        stmt = stmt.execution_options(yield_per=page, stream_results=True)
+        return self.s.execute(stmt).scalars()
+
     def exists(self, *filters: Any) -> bool:
-        q = self.s.query(self.model)
-        for f in filters:
-            q = q.filter(f)
-        result = self.s.query(q.exists()).scalar()
-        return bool(result)
+        stmt = select(sa_exists().where(*filters).select_from(self.model))
+        return bool(self.s.execute(stmt).scalar())
 
     def count(self, *filters: Any) -> int:
-        q = self.s.query(self.model)
-        for f in filters:
-            q = q.filter(f)
-        return int(q.count())
+        stmt = select(func.count()).select_from(self.model).where(*filters)
+        return int(self.s.execute(stmt).scalar_one())
+
+    def count_by(self, column: Any, *filters: Any) -> int:
+        """Count non-NULL values of `column` (COUNT(column) semantics)."""
+        stmt = select(func.count(column)).select_from(self.model).where(*filters)
+        return int(self.s.execute(stmt).scalar_one())
 
     # ---------- Write ----------
-    def create(self, **fields: Any) -> T:
+    # Each write flushes by default so callers see PKs/constraint errors immediately.
+    # Loops should pass flush=False and call flush() once at the end; objects created
+    # that way have no PK until then, so don't look them up by id in between.
+    def create(self, *, flush: bool = True, **fields: Any) -> T:
         obj = self.model(**fields)
         self.s.add(obj)
-        self.s.flush()  # get PKs without committing
+        if flush:
+            self.s.flush()  # get PKs without committing
         return obj
 
-    def update(self, obj: T, **fields: Any) -> T:
+    def update(self, obj: T, *, flush: bool = True, **fields: Any) -> T:
         for k, v in fields.items():
             setattr(obj, k, v)
-        self.s.flush()
+        if flush:
+            self.s.flush()
         return obj
 
-    def delete(self, obj: T) -> None:
+    def delete(self, obj: T, *, flush: bool = True) -> None:
         self.s.delete(obj)
+        if flush:
+            self.s.flush()
+
+    def flush(self) -> None:
+        """Explicit flush boundary for batches written with flush=False."""
+        self.s.flush()
+
+    # ---------- Bulk ----------
+    def insert_many(self, values: Sequence[Mapping[str, Any]]) -> builtins.list[Any]:
+        """
+        Insert many rows in one executemany, returning their ids in input order.
+        Uses INSERT ... RETURNING (batched via insertmanyvalues) where the backend
+        can sort returned rows by parameter order; otherwise ORM adds + one flush.
+        """
+        if not values:
+            return []
+
+        mapper = sa_inspect(self.model, raiseerr=True)
+        if self.s.get_bind().dialect.insert_executemany_returning_sort_by_parameter_order:
+            stmt = insert(self.model).returning(mapper.primary_key[0], sort_by_parameter_order=True)
+            return builtins.list(self.s.scalars(stmt, builtins.list(values)))
+
+        objs = [self.model(**row) for row in values]
+        self.s.add_all(objs)
         self.s.flush()
+        return [mapper.primary_key_from_instance(obj)[0] for obj in objs]
+
+    def upsert_values(
+        self,
+        values: Sequence[Mapping[str, Any]],
+        index_elements: Sequence[str],
+        update_columns: Sequence[str],
+    ) -> None:
+        """
+        Insert-or-update many rows in one statement.
+        - sqlite/postgresql: INSERT ... ON CONFLICT (index_elements) DO UPDATE
+        - mysql: INSERT ... ON DUPLICATE KEY UPDATE (uses the table's unique keys)
+        - other dialects: per-row SELECT on index_elements, then update or add
+        """
+        if not values:
+            return
+
+        rows = builtins.list(values)
+        dialect = self.s.get_bind().dialect.name
+        stmt: Executable
+        if dialect in ("sqlite", "postgresql"):
+            from sqlalchemy.dialects import postgresql, sqlite
+
+            conflict_insert: sqlite.Insert | postgresql.Insert
+            if dialect == "sqlite":
+                conflict_insert = sqlite.insert(self.model).values(rows)
+            else:
+                conflict_insert = postgresql.insert(self.model).values(rows)
+            stmt = conflict_insert.on_conflict_do_update(
+                index_elements=builtins.list(index_elements),
+                set_={c: conflict_insert.excluded[c] for c in update_columns},
+            )
+        elif dialect in ("mysql", "mariadb"):
+            from sqlalchemy.dialects import mysql
+
+            mysql_insert = mysql.insert(self.model).values(rows)
+            stmt = mysql_insert.on_duplicate_key_update(
+                {c: mysql_insert.inserted[c] for c in update_columns}
+            )
+        else:
+            # merge() matches on the primary key, which these rows need not carry
+            for row in rows:
+                key = {c: row[c] for c in index_elements}
+                obj = self.s.scalars(select(self.model).filter_by(**key)).one_or_none()
+                if obj is None:
+                    self.s.add(self.model(**row))
+                else:
+                    for c in update_columns:
+                        setattr(obj, c, row[c])
+            self.s.flush()
+            return
+
+        self.s.flush()  # keep ordering with pending ORM writes
+        self.s.execute(stmt)
@@ -6,8 +6,9 @@ import logging
 from collections.abc import Iterable
 from typing import Any, NoReturn
 
+from sqlalchemy import bindparam, lambda_stmt, select
 from sqlalchemy.exc import IntegrityError as SQLIntegrityError, SQLAlchemyError
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, load_only
 
 # If DimensionInput lives somewhere else in your project, adjust this import path:
 from ..domain.schemas import DimensionInput  # <-- adjust if your DimensionInput lives elsewhere
@@ -27,6 +28,12 @@ except ImportError:
     from .logging import log_operation as log_op
 
 
+# Built once at import; get_by_name only binds the stripped name.
+_DIMENSION_BY_NAME = lambda_stmt(
+    lambda: select(DimensionORM).where(DimensionORM.name == bindparam("name"))
+)
+
+
 class DimensionRepo(GenericBaseRepository[DimensionORM]):
     """
     Repository for dimension-related database operations.
@@ -78,11 +85,19 @@ class DimensionRepo(GenericBaseRepository[DimensionORM]):
         Raises:
             ValidationError: If name is invalid
         """
+        return self._get_by_name(name)
+
+    def _get_by_name(self, name: str) -> DimensionORM | None:
+        """
+        Unlogged get_by_name for per-row loops (wrap the loop in log_database_batch).
+        """
         if not name or not name.strip():
             raise ValidationError("name", "Dimension name cannot be empty")
 
         try:
-            return self.session.query(DimensionORM).filter_by(name=name.strip()).one_or_none()
+            return self.session.execute(
+                _DIMENSION_BY_NAME, {"name": name.strip()}
+            ).scalar_one_or_none()
         except SQLAlchemyError as e:
             self._handle_error(e, "get_dimension_by_name")
 
@@ -106,12 +121,13 @@ class DimensionRepo(GenericBaseRepository[DimensionORM]):
             self._handle_error(e, "get_dimension_by_id")
 
     @log_op("create_dimension")
-    def create(self, name: str | None = None, **_: Any) -> DimensionORM:
+    def create(self, name: str | None = None, *, flush: bool = True, **_: Any) -> DimensionORM:
         """
         Create new dimension.
 
         Args:
             name: Dimension name
+            flush: Flush immediately to assign the ID (pass False in batch loops)
 
         Returns:
             Created DimensionORM instance
@@ -128,13 +144,26 @@ class DimensionRepo(GenericBaseRepository[DimensionORM]):
         try:
             dimension = DimensionORM(name=validated_data.name)
             self.session.add(dimension)
-            self.session.flush()  # Get ID without committing
+            if flush:
+                self.session.flush()  # Get ID without committing
             return dimension
         except SQLIntegrityError as e:
             self._handle_error(e, "create_dimension")
         except SQLAlchemyError as e:
             self._handle_error(e, "create_dimension")
 
+    @log_op("create_dimensions")
+    def create_many(self, names: Iterable[str]) -> builtins.list[int]:
+        """
+        Create many dimensions with one batched INSERT; returns ids in input order.
+        """
+        values = [DimensionInput(name=name).model_dump() for name in names]
+
+        try:
+            return self.insert_many(values)
+        except SQLAlchemyError as e:
+            self._handle_error(e, "create_dimensions")
+
     @log_op("list_dimensions")
     def list(
         self,
@@ -142,28 +171,51 @@ class DimensionRepo(GenericBaseRepository[DimensionORM]):
         order_by: Iterable[Any] | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        only_fields: Iterable[Any] | None = None,
     ) -> builtins.list[DimensionORM]:
         """
         Get all dimensions ordered by name.
         """
         if filters or order_by is not None or limit is not None or offset is not None:
-            return super().list(*filters, order_by=order_by, limit=limit, offset=offset)
+            return super().list(
+                *filters, order_by=order_by, limit=limit, offset=offset, only_fields=only_fields
+            )
 
         try:
-            return self.session.query(DimensionORM).order_by(DimensionORM.name).all()
+            stmt = select(DimensionORM).order_by(DimensionORM.name)
+            if only_fields:
+                stmt = stmt.options(load_only(*only_fields))
+            return builtins.list(self.session.scalars(stmt).all())
         except SQLAlchemyError as e:
             self._handle_error(e, "list_dimensions")
 
+    @log_op("list_dimension_names")
+    def list_names(self) -> builtins.list[tuple[int, str]]:
+        """
+        Get (id, name) pairs for all dimensions ordered by name.
+        """
+        try:
+            rows = self.list_columns(
+                DimensionORM.id, DimensionORM.name, order_by=[DimensionORM.name]
+            )
+            return [(dim_id, name) for dim_id, name in rows]
+        except SQLAlchemyError as e:
+            self._handle_error(e, "list_dimension_names")
+
     @log_op("list_dimensions_with_themes")
     def list_with_themes(self) -> builtins.list[DimensionORM]:
         """
         Get all dimensions with eagerly loaded themes.
         """
         try:
-            return (
-                self.session.query(DimensionORM)
-                .options(joinedload(DimensionORM.themes))
-                .order_by(DimensionORM.name)
+            # joinedload on a collection repeats parent rows; unique() collapses them
+            return builtins.list(
+                self.session.scalars(
+                    select(DimensionORM)
+                    .options(joinedload(DimensionORM.themes))
+                    .order_by(DimensionORM.name)
+                )
+                .unique()
                 .all()
             )
         except SQLAlchemyError as e:
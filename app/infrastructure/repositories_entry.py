@@ -4,9 +4,14 @@ from __future__ import annotations
 import logging
 from decimal import Decimal
 import json
-from typing import NoReturn
+from datetime import datetime
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Any, NoReturn
 
+from pydantic import TypeAdapter
+from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError as SQLIntegrityError, SQLAlchemyError
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
 
 # Prefer sibling package path for schemas (app/domain/schemas.py)
@@ -14,7 +19,7 @@ from ..domain.schemas import AssessmentEntryInput
 
 # Validation schema and app exceptions
 from .exceptions import ValidationError
-from .models import AssessmentEntryORM, TopicORM
+from .models import AssessmentEntryORM, AssessmentSessionORM, TopicORM
 
 # Use the generic base (typed) — alias to avoid any name collision elsewhere
 from .repositories_base import BaseRepository as GenericBaseRepository
@@ -24,6 +29,11 @@ try:
     from .logging import log_database_operation as log_op
 except ImportError:
     from .logging import log_operation as log_op
+from .logging import log_database_batch
+
+# Compiled once and reused by bulk_upsert: one validator call per batch
+_ENTRIES_TA = TypeAdapter(list[AssessmentEntryInput])
+_KEY_AND_CREATED = frozenset({"session_id", "topic_id", "created_at"})
 
 
 class EntryRepo(GenericBaseRepository[AssessmentEntryORM]):
@@ -56,7 +66,6 @@ class EntryRepo(GenericBaseRepository[AssessmentEntryORM]):
 
     # ------------------- Operations -------------------
 
-    @log_op("upsert_entry")
     def upsert(
         self,
         session_id: int,
@@ -69,9 +78,52 @@ class EntryRepo(GenericBaseRepository[AssessmentEntryORM]):
         comment: str | None = None,
         evidence_links: list[str] | None = None,
         progress_state: str = "not_started",
+        *,
+        flush: bool = True,
+        log: bool = True,
     ) -> AssessmentEntryORM:
         """
         Create or update assessment entry.
+
+        Pass flush=False when upserting in a loop and flush once afterwards, and
+        log=False when the loop already runs inside log_database_batch.
+        """
+        upsert = self._logged_upsert if log else self._upsert
+        return upsert(
+            session_id,
+            topic_id,
+            current_maturity,
+            desired_maturity,
+            computed_score,
+            current_is_na,
+            desired_is_na,
+            comment,
+            evidence_links,
+            progress_state,
+            flush=flush,
+        )
+
+    @log_op("upsert_entry")
+    def _logged_upsert(self, *args: Any, **kwargs: Any) -> AssessmentEntryORM:
+        return self._upsert(*args, **kwargs)
+
+    def _upsert(
+        self,
+        session_id: int,
+        topic_id: int,
+        current_maturity: int | None = None,
+        desired_maturity: int | None = None,
+        computed_score: Decimal | None = None,
+        current_is_na: bool = False,
+        desired_is_na: bool = False,
+        comment: str | None = None,
+        evidence_links: list[str] | None = None,
+        progress_state: str = "not_started",
+        *,
+        flush: bool = True,
+    ) -> AssessmentEntryORM:
+        """
+        Validate and write one entry, without the per-call log records.
         """
         # Validate input using schema
         validated_data = AssessmentEntryInput(
@@ -88,42 +140,119 @@ class EntryRepo(GenericBaseRepository[AssessmentEntryORM]):
         )
 
         try:
-            obj = (
-                self.session.query(AssessmentEntryORM)
-                .filter_by(session_id=session_id, topic_id=topic_id)
-                .one_or_none()
-            )
-
-            if obj is None:
-                obj = AssessmentEntryORM(session_id=session_id, topic_id=topic_id)
-                self.session.add(obj)
-
-            # Update fields
-            obj.current_maturity = validated_data.current_maturity
-            obj.desired_maturity = validated_data.desired_maturity
-            obj.computed_score = (
-                float(validated_data.computed_score)
-                if validated_data.computed_score is not None
-                else None
-            )
-            obj.current_is_na = validated_data.current_is_na
-            obj.desired_is_na = validated_data.desired_is_na
-            obj.comment = validated_data.comment
-            obj.evidence_links = (
-                json.dumps(validated_data.evidence_links)
-                if validated_data.evidence_links
-                else None
-            )
-            obj.progress_state = validated_data.progress_state
-
-            self.session.flush()
-            return obj
-
+            return self._raw_upsert(validated_data, flush=flush)
         except SQLIntegrityError as e:
             self._handle_error(e, "upsert_entry")
         except SQLAlchemyError as e:
             self._handle_error(e, "upsert_entry")
 
+    def bulk_upsert(self, rows: Iterable[Mapping[str, Any]]) -> int:
+        """
+        Validate and upsert many entries with one validator call and one statement.
+
+        Writes go through INSERT ... ON CONFLICT (session_id, topic_id) DO UPDATE
+        (ON DUPLICATE KEY UPDATE on MySQL), backed by the uq_session_topic constraint.
+        Logged once per batch (row count and duration) rather than per row.
+        When a (session_id, topic_id) pair repeats, the last row wins.
+        Returns the number of rows written.
+        """
+        rows = list(rows)
+        with log_database_batch("bulk_upsert_entries", count=len(rows)):
+            return self._bulk_upsert(rows)
+
+    def _bulk_upsert(self, rows: list[Mapping[str, Any]]) -> int:
+        validated = _ENTRIES_TA.validate_python(rows)
+        if not validated:
+            return 0
+
+        now = datetime.utcnow()
+        # One row per key: PostgreSQL rejects an ON CONFLICT statement that
+        # touches the same row twice
+        by_key = {
+            (data.session_id, data.topic_id): {
+                "session_id": data.session_id,
+                "topic_id": data.topic_id,
+                **self._values(data),
+                "created_at": now,
+                "updated_at": now,
+            }
+            for data in validated
+        }
+        values = list(by_key.values())
+
+        try:
+            self.upsert_values(
+                values,
+                index_elements=["session_id", "topic_id"],
+                # Everything except the conflict key and the original created_at
+                update_columns=[c for c in values[0] if c not in _KEY_AND_CREATED],
+            )
+            # Rows were written with Core; drop any stale copies held by this session.
+            # Keys are read from the loaded state, as touching an expired attribute
+            # would refresh the row; an entry whose key is not loaded is expired anyway.
+            for obj in list(self.session.identity_map.values()):
+                if isinstance(obj, AssessmentEntryORM):
+                    loaded = obj.__dict__
+                    key = (loaded.get("session_id"), loaded.get("topic_id"))
+                    if key in by_key or None in key:
+                        self.session.expire(obj)
+            return len(values)
+
+        except SQLIntegrityError as e:
+            self._handle_error(e, "bulk_upsert_entries")
+        except SQLAlchemyError as e:
+            self._handle_error(e, "bulk_upsert_entries")
+
+    def _raw_upsert(
+        self, data: AssessmentEntryInput, *, flush: bool = True
+    ) -> AssessmentEntryORM:
+        """
+        Create or update an entry from already-validated input (no schema validation).
+        """
+        obj = self.session.scalars(
+            select(AssessmentEntryORM).where(
+                AssessmentEntryORM.session_id == data.session_id,
+                AssessmentEntryORM.topic_id == data.topic_id,
+            )
+        ).one_or_none()
+
+        if obj is None:
+            obj = AssessmentEntryORM(session_id=data.session_id, topic_id=data.topic_id)
+            self.session.add(obj)
+
+        self._apply(obj, data)
+
+        # Skip the round-trip when an existing row was re-saved with identical values
+        if flush and (obj in self.session.new or self.session.is_modified(obj)):
+            self.session.flush()
+        return obj
+
+    @staticmethod
+    def _values(data: AssessmentEntryInput) -> dict[str, Any]:
+        """
+        Column values for validated entry fields (shared by ORM and bulk writes).
+        """
+        return {
+            "current_maturity": data.current_maturity,
+            "desired_maturity": data.desired_maturity,
+            "computed_score": (
+                float(data.computed_score) if data.computed_score is not None else None
+            ),
+            "current_is_na": data.current_is_na,
+            "desired_is_na": data.desired_is_na,
+            "comment": data.comment,
+            "evidence_links": json.dumps(data.evidence_links) if data.evidence_links else None,
+            "progress_state": data.progress_state,
+        }
+
+    @classmethod
+    def _apply(cls, obj: AssessmentEntryORM, data: AssessmentEntryInput) -> None:
+        """
+        Copy validated entry fields onto the ORM row.
+        """
+        for field, value in cls._values(data).items():
+            setattr(obj, field, value)
+
     @log_op("list_entries_for_session")
     def list_for_session(self, session_id: int) -> list[AssessmentEntryORM]:
         """
@@ -133,16 +262,92 @@ class EntryRepo(GenericBaseRepository[AssessmentEntryORM]):
             raise ValidationError("session_id", "Session ID must be positive")
 
         try:
-            return (
-                self.session.query(AssessmentEntryORM)
-                .filter_by(session_id=session_id)
-                .join(TopicORM)
-                .order_by(TopicORM.name)
-                .all()
+            return list(
+                self.session.scalars(
+                    select(AssessmentEntryORM)
+                    .where(AssessmentEntryORM.session_id == session_id)
+                    .join(TopicORM)
+                    .order_by(TopicORM.name)
+                ).all()
             )
         except SQLAlchemyError as e:
             self._handle_error(e, "list_entries_for_session")
 
+    @log_op("list_all_entries")
+    def list_all(self, order_by: Iterable[Any] | None = None) -> list[AssessmentEntryORM]:
+        """
+        Get entries for every session in one query (newest session first, then topic name).
+        """
+        if order_by is not None:
+            return super().list(order_by=order_by)
+
+        try:
+            return list(
+                self.session.scalars(
+                    select(AssessmentEntryORM)
+                    .join(AssessmentSessionORM)
+                    .join(TopicORM)
+                    .order_by(
+                        AssessmentSessionORM.created_at.desc(),
+                        AssessmentEntryORM.session_id,
+                        TopicORM.name,
+                    )
+                ).all()
+            )
+        except SQLAlchemyError as e:
+            self._handle_error(e, "list_all_entries")
+
+    @log_op("list_all_entry_rows")
+    def list_all_rows(self) -> list[Row[Any]]:
+        """
+        Same rows and order as list_all(), as plain column rows (``row.comment`` access).
+
+        Skips ORM instance construction and identity-map bookkeeping, which dominate
+        read-only bulk reads such as backups.
+        """
+        try:
+            return list(
+                self.session.execute(
+                    select(*AssessmentEntryORM.__table__.columns)
+                    .select_from(AssessmentEntryORM)
+                    .join(AssessmentSessionORM)
+                    .join(TopicORM)
+                    .order_by(
+                        AssessmentSessionORM.created_at.desc(),
+                        AssessmentEntryORM.session_id,
+                        TopicORM.name,
+                    )
+                ).all()
+            )
+        except SQLAlchemyError as e:
+            self._handle_error(e, "list_all_entry_rows")
+
+    def iter_for_session(self, session_id: int, page: int = 1000) -> Iterator[AssessmentEntryORM]:
+        """
+        Stream entries for a session ordered by topic name, `page` rows at a time.
+
+        The session id is checked up front; the query runs, and is logged as one
+        batch, while the iterator is consumed, so errors fetching later pages are
+        handled like those of the first.
+        """
+        if session_id <= 0:
+            raise ValidationError("session_id", "Session ID must be positive")
+        return self._iter_for_session(session_id, page)
+
+    def _iter_for_session(self, session_id: int, page: int) -> Iterator[AssessmentEntryORM]:
+        stmt = (
+            select(AssessmentEntryORM)
+            .where(AssessmentEntryORM.session_id == session_id)
+            .join(TopicORM)
+            .order_by(TopicORM.name)
+            .execution_options(yield_per=page, stream_results=True)
+        )
+        with log_database_batch("iter_entries_for_session"):
+            try:
+                yield from self.session.execute(stmt).scalars()
+            except SQLAlchemyError as e:
+                self._handle_error(e, "iter_entries_for_session")
+
     @log_op("get_entry")
     def get_by_session_and_topic(self, session_id: int, topic_id: int) -> AssessmentEntryORM | None:
         """
@@ -154,11 +359,12 @@ class EntryRepo(GenericBaseRepository[AssessmentEntryORM]):
             raise ValidationError("topic_id", "Topic ID must be positive")
 
         try:
-            return (
-                self.session.query(AssessmentEntryORM)
-                .filter_by(session_id=session_id, topic_id=topic_id)
-                .one_or_none()
-            )
+            return self.session.scalars(
+                select(AssessmentEntryORM).where(
+                    AssessmentEntryORM.session_id == session_id,
+                    AssessmentEntryORM.topic_id == topic_id,
+                )
+            ).one_or_none()
         except SQLAlchemyError as e:
             self._handle_error(e, "get_entry")
 
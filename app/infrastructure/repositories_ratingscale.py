@@ -5,6 +5,7 @@ import logging
 from collections.abc import Iterable
 from typing import Any, NoReturn
 
+from sqlalchemy import select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
@@ -62,18 +63,45 @@ class RatingScaleRepo(GenericBaseRepository[RatingScaleORM]):
         if not label or not label.strip():
             raise ValidationError("label", "Rating label cannot be empty")
 
+        clean = label.strip()
         try:
             obj = self.session.get(RatingScaleORM, level)
             if obj is None:
-                obj = RatingScaleORM(level=level, label=label.strip())
+                obj = RatingScaleORM(level=level, label=clean)
                 self.session.add(obj)
+            elif obj.label == clean:
+                return obj  # no-op on idempotent re-seeds: skip the flush round-trip
             else:
-                obj.label = label.strip()
+                obj.label = clean
             self.session.flush()
             return obj
         except SQLAlchemyError as e:
             self._handle_error(e, "upsert_rating_scale")
 
+    @log_op("upsert_rating_scales")
+    def upsert_many(self, levels_labels: Iterable[tuple[int, str]]) -> None:
+        """
+        Create or update several rating scale entries in one statement.
+
+        Rows are written with Core (ON CONFLICT / ON DUPLICATE KEY), so any
+        RatingScaleORM instances already loaded in this session are expired.
+        """
+        values = []
+        for level, label in levels_labels:
+            if not (1 <= level <= 5):
+                raise ValidationError("level", "Rating level must be between 1-5")
+            if not label or not label.strip():
+                raise ValidationError("label", "Rating label cannot be empty")
+            values.append({"level": level, "label": label.strip()})
+
+        try:
+            self.upsert_values(values, index_elements=["level"], update_columns=["label"])
+            for obj in self.session.identity_map.values():
+                if isinstance(obj, RatingScaleORM):
+                    self.session.expire(obj)
+        except SQLAlchemyError as e:
+            self._handle_error(e, "upsert_rating_scales")
+
     @log_op("list_rating_scales")
     def list_all(self, order_by: Iterable[Any] | None = None) -> list[RatingScaleORM]:
         """
@@ -83,7 +111,9 @@ class RatingScaleRepo(GenericBaseRepository[RatingScaleORM]):
             return super().list(order_by=order_by)
 
         try:
-            return self.session.query(RatingScaleORM).order_by(RatingScaleORM.level).all()
+            return list(
+                self.session.scalars(select(RatingScaleORM).order_by(RatingScaleORM.level)).all()
+            )
         except SQLAlchemyError as e:
             self._handle_error(e, "list_rating_scales")
 
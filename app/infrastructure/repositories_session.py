@@ -5,6 +5,7 @@ import builtins
 from collections.abc import Iterable
 from typing import Any
 
+from sqlalchemy import inspect as sa_inspect, select
 from sqlalchemy.orm import Session
 
 from .models import AssessmentSessionORM
@@ -23,6 +24,13 @@ except ImportError:
 class SessionRepo(GenericBaseRepository[AssessmentSessionORM]):
     model = AssessmentSessionORM
 
+    # Newest first: resolved once from the mapper instead of hasattr() on every call
+    _default_order: Any = (
+        AssessmentSessionORM.created_at.desc()
+        if "created_at" in sa_inspect(AssessmentSessionORM).columns
+        else AssessmentSessionORM.id.desc()
+    )
+
     def __init__(self, session: Session):
         super().__init__(session)
 
@@ -43,8 +51,11 @@ class SessionRepo(GenericBaseRepository[AssessmentSessionORM]):
         order_by: Iterable[Any] | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        only_fields: Iterable[Any] | None = None,
     ) -> builtins.list[AssessmentSessionORM]:
-        return super().list(*filters, order_by=order_by, limit=limit, offset=offset)
+        return super().list(
+            *filters, order_by=order_by, limit=limit, offset=offset, only_fields=only_fields
+        )
 
     @log_op("session.exists")
     def exists(self, *filters: Any) -> bool:
@@ -57,27 +68,33 @@ class SessionRepo(GenericBaseRepository[AssessmentSessionORM]):
     # -------- Write --------
 
     @log_op("session.create")
-    def create(self, **fields: Any) -> AssessmentSessionORM:
-        return super().create(**fields)
+    def create(self, *, flush: bool = True, **fields: Any) -> AssessmentSessionORM:
+        return super().create(flush=flush, **fields)
+
+    @log_op("session.create_many")
+    def create_many(self, rows: Iterable[dict[str, Any]]) -> builtins.list[int]:
+        """
+        Insert many sessions in one batched INSERT, returning their ids in input order.
+        """
+        return self.insert_many(builtins.list(rows))
 
     @log_op("session.update")
-    def update(self, obj: AssessmentSessionORM, **fields: Any) -> AssessmentSessionORM:
-        return super().update(obj, **fields)
+    def update(
+        self, obj: AssessmentSessionORM, *, flush: bool = True, **fields: Any
+    ) -> AssessmentSessionORM:
+        return super().update(obj, flush=flush, **fields)
 
     @log_op("session.delete")
-    def delete(self, obj: AssessmentSessionORM) -> None:
-        super().delete(obj)
+    def delete(self, obj: AssessmentSessionORM, *, flush: bool = True) -> None:
+        super().delete(obj, flush=flush)
 
     # -------- Custom helpers --------
 
     @log_op("session.latest")
     def latest(self) -> AssessmentSessionORM | None:
-        q = self.s.query(self.model)
-        if hasattr(self.model, "created_at"):
-            q = q.order_by(self.model.created_at.desc())
-        else:
-            q = q.order_by(self.model.id.desc())
-        return q.limit(1).one_or_none()
+        return self.s.scalars(
+            select(self.model).order_by(self._default_order).limit(1)
+        ).one_or_none()
 
     @log_op("session.list_all")
     def list_all(
@@ -86,9 +103,4 @@ class SessionRepo(GenericBaseRepository[AssessmentSessionORM]):
         # Default ordering: newest first by created_at if present, else by id
         if order_by is not None:
             return super().list(order_by=order_by)
-
-        if hasattr(self.model, "created_at"):
-            order_expr: Any = self.model.created_at.desc()
-        else:
-            order_expr = self.model.id.desc()
-        return super().list(order_by=[order_expr])
+        return super().list(order_by=[self._default_order])
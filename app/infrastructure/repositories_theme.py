@@ -2,17 +2,19 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable
 from typing import Any, NoReturn
 
+from sqlalchemy import bindparam, lambda_stmt, select
 from sqlalchemy.exc import IntegrityError as SQLIntegrityError, SQLAlchemyError
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, selectinload
 
 # Adjust the import below if ThemeInput lives elsewhere
 from ..domain.schemas import ThemeInput  # <-- if needed, change to your actual path
 
 # Validation schema and app exceptions
 from .exceptions import ValidationError
-from .models import ThemeORM
+from .models import DimensionORM, ThemeORM
 
 # Use the generic base (typed) — alias to avoid any name collision elsewhere
 from .repositories_base import BaseRepository as GenericBaseRepository
@@ -24,6 +26,14 @@ except ImportError:
     from .logging import log_operation as log_op
 
 
+# Name lookups run once per spreadsheet row during seeding; build and cache the statement once.
+_THEME_BY_NAME = lambda_stmt(
+    lambda: select(ThemeORM).where(
+        ThemeORM.dimension_id == bindparam("dimension_id"), ThemeORM.name == bindparam("name")
+    )
+)
+
+
 class ThemeRepo(GenericBaseRepository[ThemeORM]):
     """
     Repository for theme-related database operations.
@@ -39,6 +49,8 @@ class ThemeRepo(GenericBaseRepository[ThemeORM]):
         # Back-compat: some existing code references self.session / _handle_error
         self.session = self.s
         self._logger = logging.getLogger(__name__)
+        # (dimension_id, name) -> id for repeated lookups within this unit of work
+        self._name_cache: dict[tuple[int, str], int] = {}
 
     # ----- internal error helper (back-compat with old BaseRepository) -----
     def _handle_error(self, exc: Exception, operation: str) -> NoReturn:
@@ -64,12 +76,21 @@ class ThemeRepo(GenericBaseRepository[ThemeORM]):
         if not name or not name.strip():
             raise ValidationError("name", "Theme name cannot be empty")
 
+        key = (dimension_id, name.strip())
         try:
-            return (
-                self.session.query(ThemeORM)
-                .filter_by(dimension_id=dimension_id, name=name.strip())
-                .one_or_none()
-            )
+            cached_id = self._name_cache.get(key)
+            if cached_id is not None:
+                theme = self.session.get(ThemeORM, cached_id)
+                if theme is not None and (theme.dimension_id, theme.name) == key:
+                    return theme
+                del self._name_cache[key]
+
+            theme = self.session.execute(
+                _THEME_BY_NAME, {"dimension_id": key[0], "name": key[1]}
+            ).scalar_one_or_none()
+            if theme is not None:
+                self._name_cache[key] = theme.id
+            return theme
         except SQLAlchemyError as e:
             self._handle_error(e, "get_theme_by_name")
 
@@ -111,12 +132,45 @@ class ThemeRepo(GenericBaseRepository[ThemeORM]):
             )
             self.session.add(theme)
             self.session.flush()
+            self._name_cache[(theme.dimension_id, theme.name)] = theme.id
             return theme
         except SQLIntegrityError as e:
             self._handle_error(e, "create_theme")
         except SQLAlchemyError as e:
             self._handle_error(e, "create_theme")
 
+    @log_op("create_themes")
+    def create_many(self, rows: Iterable[dict[str, Any]]) -> list[int]:
+        """
+        Create many themes with one batched INSERT; returns ids in input order.
+        """
+        values = [ThemeInput(**row).model_dump() for row in rows]
+
+        try:
+            ids = self.insert_many(values)
+        except SQLAlchemyError as e:
+            self._handle_error(e, "create_themes")
+        for data, theme_id in zip(values, ids, strict=True):
+            self._name_cache[(data["dimension_id"], data["name"])] = theme_id
+        return ids
+
+    @log_op("list_all_themes")
+    def list_all(self, order_by: Iterable[Any] | None = None) -> list[ThemeORM]:
+        """
+        Get all themes across all dimensions in one query.
+        """
+        if order_by is not None:
+            return super().list(order_by=order_by)
+
+        try:
+            return list(
+                self.session.scalars(
+                    select(ThemeORM).join(DimensionORM).order_by(DimensionORM.name, ThemeORM.name)
+                ).all()
+            )
+        except SQLAlchemyError as e:
+            self._handle_error(e, "list_all_themes")
+
     @log_op("list_themes_by_dimension")
     def list_by_dimension(self, dimension_id: int) -> list[ThemeORM]:
         """
@@ -126,15 +180,23 @@ class ThemeRepo(GenericBaseRepository[ThemeORM]):
             raise ValidationError("dimension_id", "Dimension ID must be positive")
 
         try:
-            return (
-                self.session.query(ThemeORM)
-                .filter_by(dimension_id=dimension_id)
-                .order_by(ThemeORM.name)
-                .all()
+            return list(
+                self.session.scalars(
+                    select(ThemeORM)
+                    .where(ThemeORM.dimension_id == dimension_id)
+                    .order_by(ThemeORM.name)
+                ).all()
             )
         except SQLAlchemyError as e:
             self._handle_error(e, "list_themes_by_dimension")
 
+    @log_op("theme_name_index")
+    def name_index(self, dimension_id: int) -> dict[str, ThemeORM]:
+        """
+        Map theme name -> theme for a dimension in one query (for per-row ingest lookups).
+        """
+        return {theme.name: theme for theme in self.list_by_dimension(dimension_id)}
+
     @log_op("list_themes_with_topics")
     def list_by_dimension_with_topics(self, dimension_id: int) -> list[ThemeORM]:
         """
@@ -144,12 +206,13 @@ class ThemeRepo(GenericBaseRepository[ThemeORM]):
             raise ValidationError("dimension_id", "Dimension ID must be positive")
 
         try:
-            return (
-                self.session.query(ThemeORM)
-                .options(joinedload(ThemeORM.topics))
-                .filter_by(dimension_id=dimension_id)
-                .order_by(ThemeORM.name)
-                .all()
+            return list(
+                self.session.scalars(
+                    select(ThemeORM)
+                    .options(selectinload(ThemeORM.topics))
+                    .where(ThemeORM.dimension_id == dimension_id)
+                    .order_by(ThemeORM.name)
+                ).all()
             )
         except SQLAlchemyError as e:
             self._handle_error(e, "list_themes_with_topics")
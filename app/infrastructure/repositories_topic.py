@@ -5,6 +5,7 @@ import logging
 from collections.abc import Iterable
 from typing import Any, NoReturn
 
+from sqlalchemy import bindparam, lambda_stmt, select
 from sqlalchemy.exc import IntegrityError as SQLIntegrityError, SQLAlchemyError
 from sqlalchemy.orm import (
     Session,
@@ -27,6 +28,14 @@ except ImportError:
     from .logging import log_operation as log_op
 
 
+# Cached lambda statement: per-row topic lookups skip rebuilding the SELECT.
+_TOPIC_BY_NAME = lambda_stmt(
+    lambda: select(TopicORM).where(
+        TopicORM.theme_id == bindparam("theme_id"), TopicORM.name == bindparam("name")
+    )
+)
+
+
 class TopicRepo(GenericBaseRepository[TopicORM]):
     """
     Repository for topic-related database operations.
@@ -42,6 +51,8 @@ class TopicRepo(GenericBaseRepository[TopicORM]):
         # Back-compat: some existing code references self.session / _handle_error
         self.session = self.s
         self._logger = logging.getLogger(__name__)
+        # (theme_id, name) -> id for repeated lookups within this unit of work
+        self._name_cache: dict[tuple[int, str], int] = {}
 
     # ----- internal error helper (back-compat with old BaseRepository) -----
     def _handle_error(self, exc: Exception, operation: str) -> NoReturn:
@@ -67,12 +78,21 @@ class TopicRepo(GenericBaseRepository[TopicORM]):
         if not name or not name.strip():
             raise ValidationError("name", "Topic name cannot be empty")
 
+        key = (theme_id, name.strip())
         try:
-            return (
-                self.session.query(TopicORM)
-                .filter_by(theme_id=theme_id, name=name.strip())
-                .one_or_none()
-            )
+            cached_id = self._name_cache.get(key)
+            if cached_id is not None:
+                topic = self.session.get(TopicORM, cached_id)
+                if topic is not None and (topic.theme_id, topic.name) == key:
+                    return topic
+                del self._name_cache[key]
+
+            topic = self.session.execute(
+                _TOPIC_BY_NAME, {"theme_id": key[0], "name": key[1]}
+            ).scalar_one_or_none()
+            if topic is not None:
+                self._name_cache[key] = topic.id
+            return topic
         except SQLAlchemyError as e:
             self._handle_error(e, "get_topic_by_name")
 
@@ -81,6 +101,12 @@ class TopicRepo(GenericBaseRepository[TopicORM]):
         """
         Get topic by ID.
         """
+        return self._get_by_id(topic_id)
+
+    def _get_by_id(self, topic_id: int) -> TopicORM | None:
+        """
+        Unlogged get_by_id for per-row loops (wrap the loop in log_database_batch).
+        """
         if topic_id <= 0:
             raise ValidationError("topic_id", "Topic ID must be positive")
 
@@ -89,11 +115,28 @@ class TopicRepo(GenericBaseRepository[TopicORM]):
         except SQLAlchemyError as e:
             self._handle_error(e, "get_topic_by_id")
 
-    def get_by_id_required(self, topic_id: int) -> TopicORM:
+    @log_op("get_topics_by_ids")
+    def get_many_by_ids(self, topic_ids: Iterable[int]) -> dict[int, TopicORM]:
+        """
+        Load many topics in one IN query, keyed by id (also warms the identity map).
+        """
+        ids = {topic_id for topic_id in topic_ids if topic_id > 0}
+        if not ids:
+            return {}
+
+        try:
+            topics = self.session.scalars(select(TopicORM).where(TopicORM.id.in_(ids)))
+            return {topic.id: topic for topic in topics}
+        except SQLAlchemyError as e:
+            self._handle_error(e, "get_topics_by_ids")
+
+    def get_by_id_required(self, topic_id: int, *, log: bool = True) -> TopicORM:
         """
         Get topic by ID, raising exception if not found.
+
+        Pass log=False when the lookup runs inside a log_database_batch loop.
         """
-        topic = self.get_by_id(topic_id)
+        topic = self.get_by_id(topic_id) if log else self._get_by_id(topic_id)
         if topic is None:
             raise TopicNotFoundError(topic_id)
         return topic
@@ -147,12 +190,28 @@ class TopicRepo(GenericBaseRepository[TopicORM]):
             )
             self.session.add(topic)
             self.session.flush()
+            self._name_cache[(topic.theme_id, topic.name)] = topic.id
             return topic
         except SQLIntegrityError as e:
             self._handle_error(e, "create_topic")
         except SQLAlchemyError as e:
             self._handle_error(e, "create_topic")
 
+    @log_op("create_topics")
+    def create_many(self, rows: Iterable[dict[str, Any]]) -> list[int]:
+        """
+        Create many topics with one batched INSERT; returns ids in input order.
+        """
+        values = [TopicInput(**row).model_dump() for row in rows]
+
+        try:
+            ids = self.insert_many(values)
+        except SQLAlchemyError as e:
+            self._handle_error(e, "create_topics")
+        for data, topic_id in zip(values, ids, strict=True):
+            self._name_cache[(data["theme_id"], data["name"])] = topic_id
+        return ids
+
     @log_op("list_topics_by_theme")
     def list_by_theme(self, theme_id: int) -> list[TopicORM]:
         """
@@ -162,15 +221,21 @@ class TopicRepo(GenericBaseRepository[TopicORM]):
             raise ValidationError("theme_id", "Theme ID must be positive")
 
         try:
-            return (
-                self.session.query(TopicORM)
-                .filter_by(theme_id=theme_id)
-                .order_by(TopicORM.name)
-                .all()
+            return list(
+                self.session.scalars(
+                    select(TopicORM).where(TopicORM.theme_id == theme_id).order_by(TopicORM.name)
+                ).all()
             )
         except SQLAlchemyError as e:
             self._handle_error(e, "list_topics_by_theme")
 
+    @log_op("topic_name_index")
+    def name_index(self, theme_id: int) -> dict[str, TopicORM]:
+        """
+        Map topic name -> topic for a theme in one query (for per-row ingest lookups).
+        """
+        return {topic.name: topic for topic in self.list_by_theme(theme_id)}
+
     @log_op("list_all_topics")
     def list_all(self, order_by: Iterable[Any] | None = None) -> list[TopicORM]:
         """
@@ -180,12 +245,13 @@ class TopicRepo(GenericBaseRepository[TopicORM]):
             return super().list(order_by=order_by)
 
         try:
-            return (
-                self.session.query(TopicORM)
-                .join(ThemeORM)
-                .join(DimensionORM)
-                .order_by(DimensionORM.name, ThemeORM.name, TopicORM.name)
-                .all()
+            return list(
+                self.session.scalars(
+                    select(TopicORM)
+                    .join(ThemeORM)
+                    .join(DimensionORM)
+                    .order_by(DimensionORM.name, ThemeORM.name, TopicORM.name)
+                ).all()
             )
         except SQLAlchemyError as e:
             self._handle_error(e, "list_all_topics")
@@ -21,3 +21,12 @@ class UnitOfWork:
             raise
         finally:
             s.close()
+
+    @contextmanager
+    def read(self) -> Iterator[Session]:
+        # Read-only callers skip the COMMIT round trip; close() just returns the connection.
+        s = self.SessionLocal()
+        try:
+            yield s
+        finally:
+            s.close()
@@ -3,10 +3,24 @@ from __future__ import annotations
 import io
 import json
 
+import numpy as np
 import pandas as pd
+import xlsxwriter
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# Built once: json.dumps(indent=...) constructs a new encoder per call and forces
+# the pure-Python path, while a compact encoder keeps the C accelerator.
+# allow_nan=False: a stray NaN must fail loudly rather than produce invalid JSON.
+_encode_json = json.JSONEncoder(separators=(",", ":"), default=str, allow_nan=False).encode
 
 
 def _to_iso(val):
+    if val is pd.NaT:
+        return None
     if hasattr(val, "isoformat"):
         try:
             return val.isoformat()
@@ -15,15 +29,42 @@ def _to_iso(val):
     return val
 
 
+def _iso_column(column: pd.Series) -> np.ndarray:
+    """Vectorized isoformat() for a naive datetime column (NaT becomes None)."""
+    values = column.to_numpy(dtype="datetime64[us]")
+    text = np.datetime_as_string(values, unit="us").astype(object)
+    # isoformat() leaves out the fraction when it is zero
+    whole_seconds = values.astype("int64") % 1_000_000 == 0
+    text[whole_seconds] = np.datetime_as_string(values[whole_seconds], unit="s")
+    text[np.isnat(values)] = None
+    return text
+
+
+def _json_records(frame: pd.DataFrame) -> list[dict]:
+    """Rows as dicts with missing values (NaN, NaT, NA) as None, written as null."""
+    return frame.astype(object).where(frame.notna(), None).to_dict(orient="records")
+
+
 def make_json_export_payload(
     session_id: int, topics_df: pd.DataFrame, entries_df: pd.DataFrame
-) -> str:
+) -> bytes:
+    # Only the timestamp columns need converting; tz-aware ones keep the per-cell path
+    iso_columns = {
+        **{col: _iso_column(entries_df[col]) for col in entries_df.select_dtypes("datetime")},
+        **{
+            col: entries_df[col].map(_to_iso)
+            for col in entries_df.select_dtypes("datetimetz")
+        },
+    }
     payload = {
         "session_id": session_id,
-        "topics": topics_df.to_dict(orient="records"),
-        "entries": entries_df.map(_to_iso).to_dict(orient="records"),
+        "topics": _json_records(topics_df),
+        "entries": _json_records(entries_df.assign(**iso_columns)),
     }
-    return json.dumps(payload, indent=2)
+    if orjson is not None:
+        # orjson emits UTF-8 bytes directly
+        return orjson.dumps(payload, default=str, option=orjson.OPT_SERIALIZE_NUMPY)
+    return _encode_json(payload).encode("utf-8")
 
 
 def make_xlsx_export_bytes(topics_df: pd.DataFrame, entries_df: pd.DataFrame) -> bytes:
@@ -61,10 +102,7 @@ def make_xlsx_export_bytes(topics_df: pd.DataFrame, entries_df: pd.DataFrame) ->
             ]
         )
 
-    # Ensure both frames share consistent structure before merging
-    topics_df = topics_df.copy()
-    entries_df = entries_df.copy()
-
+    # merge() and reindex() below both return new frames, so the inputs are never mutated
     combined = topics_df.merge(entries_df, how="left", on="TopicID") if not topics_df.empty else entries_df
 
     # Guarantee column ordering and presence for consumers opening the sheet in Excel
@@ -93,16 +131,28 @@ def make_xlsx_export_bytes(topics_df: pd.DataFrame, entries_df: pd.DataFrame) ->
         "N/A",
     ]
 
-    for column in ordered_columns:
-        if column not in combined.columns:
-            combined[column] = pd.NA
-
+    combined = combined.reindex(columns=ordered_columns)
     combined["Rating"] = combined["CurrentMaturity"]
     combined["N/A"] = combined["CurrentNA"]
 
-    combined = combined[ordered_columns]
+    # Same cell values as DataFrame.to_excel: lists as text, blanks for missing values
+    cells = combined.astype(object)
+    cells["EvidenceLinks"] = (
+        cells["EvidenceLinks"]
+        .map(lambda links: str(links) if isinstance(links, list) else links)
+        .astype(object)
+    )
+    cells = cells.where(combined.notna(), None)
 
+    # Stream rows in order so constant_memory mode only keeps the current row in memory
     bio = io.BytesIO()
-    with pd.ExcelWriter(bio, engine="xlsxwriter") as writer:
-        combined.to_excel(writer, index=False, sheet_name="Assessment")
+    workbook = xlsxwriter.Workbook(
+        bio, {"constant_memory": True, "default_date_format": "yyyy-mm-dd hh:mm:ss"}
+    )
+    worksheet = workbook.add_worksheet("Assessment")
+    header = workbook.add_format({"bold": True, "border": 1, "align": "center", "valign": "top"})
+    worksheet.write_row(0, 0, ordered_columns, header)
+    for row_number, row in enumerate(cells.itertuples(index=False, name=None), start=1):
+        worksheet.write_row(row_number, 0, row)
+    workbook.close()
     return bio.getvalue()
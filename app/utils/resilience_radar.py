@@ -1,9 +1,26 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
 import numpy as np
 import pandas as pd
-import plotly.graph_objects as go
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import plotly.graph_objects as go
+    from numpy.typing import ArrayLike
+
+# plotly is imported inside the figure builders: the colour helpers are used on their
+# own (dashboard tiles), and plotly's import cost should only be paid for a radar.
 
 
 # --- Color interpolation helpers (kept module-level for reuse) ---
+@lru_cache(maxsize=256)  # stops repeat across every tile/bar; parse each hex once
 def hex_to_rgb(h: str) -> tuple[int, int, int]:
     h = h.lstrip("#")
     return (
@@ -35,57 +52,119 @@ DEFAULT_STOPS: list[tuple[float, str]] = [
 
 def gradient_color(value: float, stops: list[tuple[float, str]] = DEFAULT_STOPS) -> str:
     """Piecewise-linear interpolation across hex color stops."""
-    v = float(value)
-    if v <= stops[0][0]:
-        return stops[0][1]
-    if v >= stops[-1][0]:
-        return stops[-1][1]
-    for i in range(len(stops) - 1):
-        v0, c0 = stops[i]
-        v1, c1 = stops[i + 1]
-        if v0 <= v <= v1:
-            t = 0.0 if v1 == v0 else (v - v0) / (v1 - v0)
-            r0, g0, b0 = hex_to_rgb(c0)
-            r1, g1, b1 = hex_to_rgb(c1)
-            r = int(round(lerp(r0, r1, t)))
-            g = int(round(lerp(g0, g1, t)))
-            b = int(round(lerp(b0, b1, t)))
-            return rgb_to_hex((r, g, b))
-    return stops[-1][1]
-
-
-def _add_theme_bar(fig, *, theta_left, theta_right, r0, r1, color, theme_name, theme_mean):
-    # visible filled bar
-    fig.add_trace(
-        go.Scatterpolar(
-            theta=[theta_left, theta_right, theta_right, theta_left, theta_left],
-            r=[r0, r0, r1, r1, r0],
-            mode="lines",
-            line=dict(width=0.5, color=color),
-            fill="toself",
-            fillcolor=color,
-            name="",
-            showlegend=False,
-            hoverinfo="skip",
-        )
-    )
-    # invisible hover target at center
-    theta_mid = (theta_left + theta_right) / 2.0
-    r_mid = (r0 + r1) / 2.0
-    fig.add_trace(
-        go.Scatterpolar(
-            theta=[theta_mid],
-            r=[r_mid],
-            mode="markers",
-            marker=dict(size=32, color="rgba(0,0,0,0)"),
-            name="",
-            showlegend=False,
-            hovertemplate=f"{theme_name} - {theme_mean:.2f}<extra></extra>",
-        )
-    )
+    return _gradient_color_cached(float(value), tuple(stops))
+
+
+# Averages of 1-5 ratings take few distinct values, so most calls are cache hits
+@lru_cache(maxsize=1024)
+def _gradient_color_cached(v: float, stops: tuple[tuple[float, str], ...]) -> str:
+    return str(gradient_colors([v], stops)[0])
+
+
+_HEX_BYTE = np.array([f"{i:02X}" for i in range(256)], dtype=object)
+
+
+def gradient_colors(
+    values: ArrayLike, stops: Sequence[tuple[float, str]] = DEFAULT_STOPS
+) -> np.ndarray:
+    """gradient_color over an array in one pass; returns an object array of hex strings."""
+    v = np.asarray(values, dtype=float)
+    if len(stops) == 1:
+        return np.full(v.shape, stops[0][1], dtype=object)
+
+    stop_values = np.array([s for s, _ in stops], dtype=float)
+    stop_rgb = np.array([hex_to_rgb(c) for _, c in stops], dtype=float)
+
+    # First segment whose [v0, v1] contains v
+    seg = np.clip(np.searchsorted(stop_values, v, side="left") - 1, 0, len(stops) - 2)
+    v0, v1 = stop_values[seg], stop_values[seg + 1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = np.where(v1 == v0, 0.0, (v - v0) / (v1 - v0))
+    # Out-of-range and NaN values are overwritten below; keep them in the lookup's range
+    t = np.clip(np.nan_to_num(t), 0.0, 1.0)
+    c0, c1 = stop_rgb[seg], stop_rgb[seg + 1]
+    # np.rint rounds half to even, like round()
+    rgb = np.rint(c0 + (c1 - c0) * t[..., None]).astype(np.intp)
+    colors = "#" + _HEX_BYTE[rgb[..., 0]] + _HEX_BYTE[rgb[..., 1]] + _HEX_BYTE[rgb[..., 2]]
+
+    # Out-of-range (and NaN) values take the end stop colours verbatim
+    colors[v <= stop_values[0]] = stops[0][1]
+    colors[(v >= stop_values[-1]) | np.isnan(v)] = stops[-1][1]
+    return colors
+
+
+# Built figures (as plain dicts) keyed on a digest of the inputs; see _figure_key
+_FIGURE_CACHE_SIZE = 32
+_figure_cache: OrderedDict[tuple, dict] = OrderedDict()
+_figure_cache_lock = threading.Lock()
+
+_SCORE_COLUMNS = ["Dimension", "Theme", "Question", "Score"]
+
+
+def _frame_digest(frame: pd.DataFrame | None) -> bytes | None:
+    if frame is None or frame.empty:
+        return b""
+    if not set(_SCORE_COLUMNS) <= set(frame.columns):
+        return None
+    hashed = pd.util.hash_pandas_object(frame[_SCORE_COLUMNS], index=False)
+    return hashlib.blake2b(hashed.to_numpy().tobytes(), digest_size=16).digest()
+
+
+def _figure_key(
+    scores: pd.DataFrame,
+    target_scores: pd.DataFrame | None,
+    dimension_order: list[str] | None,
+    *params: object,
+) -> tuple | None:
+    """Content key for a radar build, or None when the inputs are not cacheable."""
+    scores_digest = _frame_digest(scores)
+    target_digest = _frame_digest(target_scores)
+    if scores_digest is None or target_digest is None:
+        return None
+    order = tuple(dimension_order) if dimension_order is not None else None
+    return (scores_digest, target_digest, order, *params)
 
 
 def make_resilience_radar_with_theme_bars(
+    scores: pd.DataFrame,
+    target_scores: pd.DataFrame | None = None,
+    dimension_order: list[str] | None = None,
+    title: str | None = None,
+    max_score: float = 5.0,
+    bar_base: float = 5.35,
+    bar_total_height: float = 0.8,
+    bar_width_deg: float = 1.4,
+    bar_gap_deg: float = 0.6,
+) -> go.Figure:
+    """
+    Radar chart with theme mini bars (see _build_radar_figure), cached by input content.
+
+    Identical scores, targets and layout parameters return a fresh Figure rebuilt from
+    the cached one, so callers may mutate the result freely.
+    """
+    import plotly.graph_objects as go
+
+    params = (title, max_score, bar_base, bar_total_height, bar_width_deg, bar_gap_deg)
+    key = _figure_key(scores, target_scores, dimension_order, *params)
+    if key is not None:
+        with _figure_cache_lock:
+            cached = _figure_cache.get(key)
+            if cached is not None:
+                _figure_cache.move_to_end(key)
+        if cached is not None:
+            return go.Figure(cached)
+
+    fig = _build_radar_figure(scores, target_scores, dimension_order, *params)
+
+    if key is not None:
+        with _figure_cache_lock:
+            _figure_cache[key] = fig.to_dict()
+            while len(_figure_cache) > _FIGURE_CACHE_SIZE:
+                _figure_cache.popitem(last=False)
+    return fig
+
+
+def _build_radar_figure(
     scores: pd.DataFrame,
     target_scores: pd.DataFrame | None = None,
     dimension_order: list[str] | None = None,
@@ -103,6 +182,8 @@ def make_resilience_radar_with_theme_bars(
 
     Parameters match the original; visual output is intentionally identical.
     """
+    import plotly.graph_objects as go
+
     # -------- input validation --------
     required_cols = {"Dimension", "Theme", "Question", "Score"}
     missing = required_cols - set(scores.columns)
@@ -125,10 +206,24 @@ def make_resilience_radar_with_theme_bars(
         target_df["Score"] = target_df["Score"].astype(float).clip(lower=0.0, upper=float(max_score))
 
     # -------- summaries --------
-    dim_summary = scores.groupby("Dimension", as_index=False).agg(mean_score=("Score", "mean"))
+    # A single groupby over the score rows; dimension means are then rebuilt from the
+    # (much smaller) per-theme sums and counts, which equals averaging the rows directly
     theme_summary = scores.groupby(["Dimension", "Theme"], as_index=False).agg(
-        theme_mean=("Score", "mean")
+        theme_sum=("Score", "sum"), theme_count=("Score", "count")
+    )
+    theme_summary["theme_mean"] = (theme_summary["theme_sum"] / theme_summary["theme_count"]).where(
+        theme_summary["theme_count"] > 0
     )
+    dim_totals = theme_summary.groupby("Dimension", as_index=False)[
+        ["theme_sum", "theme_count"]
+    ].sum()
+    dim_summary = pd.DataFrame(
+        {
+            "Dimension": dim_totals["Dimension"],
+            "mean_score": dim_totals["theme_sum"] / dim_totals["theme_count"],
+        }
+    )
+    theme_summary = theme_summary.drop(columns=["theme_sum", "theme_count"])
     target_summary = None
     if target_df is not None:
         target_summary = target_df.groupby("Dimension", as_index=False).agg(target_mean=("Score", "mean"))
@@ -155,18 +250,19 @@ def make_resilience_radar_with_theme_bars(
         target_summary = target_summary.dropna(subset=["target_mean"])
 
     # -------- colours (unchanged behaviour) --------
-    dim_summary["mean_color"] = dim_summary["mean_score"].apply(gradient_color)
-    theme_summary["bar_color"] = theme_summary["theme_mean"].apply(gradient_color)
+    dim_summary["mean_color"] = gradient_colors(dim_summary["mean_score"].to_numpy())
+    theme_summary["bar_color"] = gradient_colors(theme_summary["theme_mean"].to_numpy())
 
     # -------- figure --------
     fig = go.Figure()
 
     # Radar polygon (connect dimension means) — keep the subtle fill as in original
-    r_vals = dim_summary["mean_score"].tolist()
-    theta_vals = dim_summary["theta"].tolist()
-    if len(r_vals) >= 1:
-        r_loop = r_vals + [r_vals[0]]
-        theta_loop = theta_vals + [theta_vals[0]]
+    # Closed by repeating the first point; arrays go to plotly as-is, with no list round-trip
+    r_vals = dim_summary["mean_score"].to_numpy(dtype=float)
+    theta_vals = dim_summary["theta"].to_numpy(dtype=float)
+    if r_vals.size >= 1:
+        r_loop = np.concatenate([r_vals, r_vals[:1]])
+        theta_loop = np.concatenate([theta_vals, theta_vals[:1]])
         fig.add_trace(
             go.Scatterpolar(
                 r=r_loop,
@@ -180,11 +276,11 @@ def make_resilience_radar_with_theme_bars(
             )
         )
     if target_summary is not None and not target_summary.empty:
-        t_vals = target_summary["target_mean"].tolist()
-        t_theta = target_summary["theta"].tolist()
-        if len(t_vals) >= 1:
-            t_loop = t_vals + [t_vals[0]]
-            t_theta_loop = t_theta + [t_theta[0]]
+        t_vals = target_summary["target_mean"].to_numpy(dtype=float)
+        t_theta = target_summary["theta"].to_numpy(dtype=float)
+        if t_vals.size >= 1:
+            t_loop = np.concatenate([t_vals, t_vals[:1]])
+            t_theta_loop = np.concatenate([t_theta, t_theta[:1]])
             fig.add_trace(
                 go.Scatterpolar(
                     r=t_loop,
@@ -213,43 +309,73 @@ def make_resilience_radar_with_theme_bars(
         )
     )
 
-    # Grouped mini bars at spoke tip (one bar per Theme) — draw as polar rectangles
-    for _, drow in dim_summary.iterrows():
-        dname = drow["Dimension"]
-        theta_center = float(drow["theta"])
-        # Stable order by theme name
-        ts = theme_summary[theme_summary["Dimension"] == dname].sort_values("Theme")
-        k = int(ts.shape[0])
-        if k == 0:
-            continue
-
-        total_span = k * bar_width_deg + (k - 1) * bar_gap_deg
-        start = theta_center - total_span / 2.0
-
-        for idx, (_, trow) in enumerate(ts.iterrows()):
-            theta_left = start + idx * (bar_width_deg + bar_gap_deg)
-            theta_right = theta_left + bar_width_deg
-
-            # Height scaled into compact band beyond the 5-ring:
-            theme_name = str(trow["Theme"])
-            theme_mean = float(trow["theme_mean"])
-            height = float(bar_total_height) * (theme_mean / float(max_score))
-            height = max(0.0, height)  # guard
-
-            r0 = float(bar_base)
-            r1 = float(bar_base) + height
-
-            # Draw a filled polar rectangle (as a closed polygon)
-            _add_theme_bar(
-                fig,
-                theta_left=theta_left,
-                theta_right=theta_right,
-                r0=r0,
-                r1=r1,
-                color=trow["bar_color"],
-                theme_name=theme_name,
-                theme_mean=theme_mean,
+    # Grouped mini bars at spoke tip (one bar per Theme) — draw as polar rectangles.
+    # Bar geometry is plain array arithmetic over the bars sorted by (spoke, theme).
+    dim_pos = pd.Series(range(len(dim_summary)), index=dim_summary["Dimension"])
+    bars = (
+        theme_summary.assign(dim_pos=theme_summary["Dimension"].map(dim_pos))
+        .dropna(subset=["dim_pos"])
+        .sort_values(["dim_pos", "Theme"], kind="stable")  # stable order by theme name
+    )
+    spoke = bars["dim_pos"].to_numpy(dtype=np.intp)
+    per_spoke = np.bincount(spoke, minlength=len(dim_summary))
+    k = per_spoke[spoke]  # bars sharing this bar's spoke
+    first = np.cumsum(per_spoke) - per_spoke  # row of each spoke's first bar
+    idx = np.arange(len(spoke)) - first[spoke]  # position within the spoke's group
+    total_span = k * bar_width_deg + (k - 1) * bar_gap_deg
+    left = (
+        bars["theta"].to_numpy(dtype=float)
+        - total_span / 2.0
+        + idx * (bar_width_deg + bar_gap_deg)
+    )
+    right = left + bar_width_deg
+    # Height scaled into compact band beyond the 5-ring
+    means = bars["theme_mean"].to_numpy(dtype=float)
+    heights = np.clip(float(bar_total_height) * (means / float(max_score)), 0.0, None)
+    r0 = np.full_like(left, float(bar_base))
+    r1 = r0 + heights
+    gap = np.full_like(left, np.nan)
+
+    # Each bar is a closed rectangle; NaN gaps let one "toself" trace fill many of them.
+    # fillcolor is per trace, so bars are batched into one trace per distinct colour.
+    poly_theta = np.column_stack([left, right, right, left, left, gap])
+    poly_r = np.column_stack([r0, r0, r1, r1, r0, gap])
+    bar_colors = bars["bar_color"].to_numpy()
+    for color in pd.unique(bar_colors):
+        same = bar_colors == color
+        fig.add_trace(
+            go.Scatterpolar(
+                theta=poly_theta[same].ravel(),
+                r=poly_r[same].ravel(),
+                mode="lines",
+                line=dict(width=0.5, color=color),
+                fill="toself",
+                fillcolor=color,
+                name="",
+                showlegend=False,
+                hoverinfo="skip",
+            )
+        )
+
+    # One invisible hover target per bar, at its centre, all in a single trace
+    if len(bars):
+        fig.add_trace(
+            go.Scatterpolar(
+                theta=(left + right) / 2.0,
+                r=(r0 + r1) / 2.0,
+                mode="markers",
+                marker=dict(size=32, color="rgba(0,0,0,0)"),
+                name="",
+                showlegend=False,
+                hovertext=[
+                    f"{theme_name} - {theme_mean:.2f}"
+                    for theme_name, theme_mean in zip(
+                        bars["Theme"].astype(str), bars["theme_mean"].astype(float), strict=True
+                    )
+                ],
+                hovertemplate="%{hovertext}<extra></extra>",
             )
+        )
 
     # Default headline if not supplied (unchanged)
     if title is None and len(dim_summary):
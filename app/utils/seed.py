@@ -22,10 +22,11 @@ def initialise_database(engine: Engine) -> bool:
 
     inspector = inspect(engine)
     existing_tables = set(inspector.get_table_names())
-    expected_tables = [table.name for table in Base.metadata.sorted_tables]
-    already_exists = all(table in existing_tables for table in expected_tables)
-    Base.metadata.create_all(engine)
-    return already_exists
+    missing = [table for table in Base.metadata.sorted_tables if table.name not in existing_tables]
+    if missing:
+        # Only the missing tables; checkfirst stays on in case another worker races us
+        Base.metadata.create_all(engine, tables=missing)
+    return not missing
 
 
 def seed_database_from_excel(cfg: DBConfig, excel_path: Path) -> tuple[int, str, str, str]:
@@ -1,11 +1,27 @@
 ﻿from __future__ import annotations
 
 from functools import lru_cache
+from os import PathLike, stat_result
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any
 import json
 
+import anyio
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 BUILD_DIR = Path(__file__).resolve().parent / "static" / "frontend"
+HASHED_ASSETS_DIR = BUILD_DIR / "assets"
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+MAX_IN_MEMORY_ASSET_SIZE = 1024 * 1024
+ASSET_URL_PREFIX = "/static/frontend/"
 MANIFEST_CANDIDATES = [
     BUILD_DIR / "manifest.json",
     BUILD_DIR / ".vite" / "manifest.json",
@@ -13,51 +29,98 @@ MANIFEST_CANDIDATES = [
 
 
 @lru_cache(maxsize=1)
-def load_manifest() -> Dict[str, Any]:
+def load_manifest() -> dict[str, Any]:
     for manifest_path in MANIFEST_CANDIDATES:
         if manifest_path.exists():
             try:
-                return json.loads(manifest_path.read_text(encoding="utf-8"))
+                # Parse the raw bytes; no intermediate str (orjson.JSONDecodeError
+                # subclasses json.JSONDecodeError, so one except covers both)
+                raw = manifest_path.read_bytes()
+                return orjson.loads(raw) if orjson is not None else json.loads(raw)
             except json.JSONDecodeError:
                 continue
     return {}
 
 
-def get_frontend_assets() -> dict[str, List[str]]:
+@lru_cache(maxsize=1)
+def get_frontend_assets() -> dict[str, tuple[str, ...]]:
+    # Resolved once per manifest load; every SPA page render shares the same result,
+    # so the URL lists are frozen into tuples that no caller can mutate.
     manifest = load_manifest()
     if not manifest:
         # Fallback to dev mode placeholders; actual dev server handled separately
         return {
-            "scripts": ["/static/frontend/main.js"],
-            "styles": [],
+            "scripts": ("/static/frontend/main.js",),
+            "styles": (),
         }
 
     entry = manifest.get("index.html")
     if not isinstance(entry, dict):
-        return {"scripts": [], "styles": []}
-
-    scripts: List[str] = []
-    styles: List[str] = []
+        return {"scripts": (), "styles": ()}
 
-    entry_file = entry.get("file")
-    if entry_file:
-        scripts.append(f"/static/frontend/{entry_file}")
-
-    for css in entry.get("css", []):
-        styles.append(f"/static/frontend/{css}")
-
-    for dynamic in entry.get("imports", []):
+    # Entry first, then its imported chunks, in manifest order
+    chunks = [entry]
+    for dynamic in entry.get("imports") or ():
         chunk = manifest.get(dynamic)
         if isinstance(chunk, dict):
-            file_path = chunk.get("file")
-            if file_path:
-                scripts.append(f"/static/frontend/{file_path}")
-            for css in chunk.get("css", []):
-                styles.append(f"/static/frontend/{css}")
+            chunks.append(chunk)
 
-    return {"scripts": scripts, "styles": styles}
+    scripts: list[str] = [chunk["file"] for chunk in chunks if chunk.get("file")]
+    styles: list[str] = [css for chunk in chunks for css in chunk.get("css") or ()]
+    return {
+        "scripts": tuple(ASSET_URL_PREFIX + path for path in scripts),
+        "styles": tuple(ASSET_URL_PREFIX + path for path in styles),
+    }
 
 
 def reset_manifest_cache() -> None:
     load_manifest.cache_clear()
+    get_frontend_assets.cache_clear()
 
+
+
+class HashedAssetStaticFiles(StaticFiles):
+    """Serve Vite's content-hashed build output with a long-lived immutable cache policy.
+
+    A hashed file never changes under its name, so after the first request small
+    files are answered from memory without a path lookup or stat per request.
+    """
+
+    def __init__(self, *args: Any, max_cached_size: int = MAX_IN_MEMORY_ASSET_SIZE, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.max_cached_size = max_cached_size
+        self._in_memory: dict[str, tuple[bytes, Headers]] = {}
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        cached = self._in_memory.get(path)
+        request_headers = Headers(scope=scope)
+        # HEAD and range requests keep Starlette's handling
+        if cached is not None and scope["method"] == "GET" and "range" not in request_headers:
+            body, headers = cached
+            if self.is_not_modified(headers, request_headers):
+                return NotModifiedResponse(headers)
+            return Response(body, headers=headers)
+
+        response = await super().get_response(path, scope)
+        file_stat = getattr(response, "stat_result", None)
+        if (
+            isinstance(response, FileResponse)
+            and response.status_code == 200
+            and file_stat is not None
+            and file_stat.st_size <= self.max_cached_size
+        ):
+            body = await anyio.to_thread.run_sync(Path(response.path).read_bytes)
+            self._in_memory[path] = (body, Headers(raw=list(response.headers.raw)))
+        return response
+
+    def file_response(
+        self,
+        full_path: PathLike[str] | str,
+        stat_result: stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        # A changed stylesheet or bundle gets a new file name, so browsers never need to revalidate.
+        response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+        return response
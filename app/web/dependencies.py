@@ -27,17 +27,25 @@ def get_session_factory(request: Request) -> sessionmaker[Session]:
     config = get_db_config(request)
     cached_factory = getattr(request.app.state, "session_factory", None)
     cached_config = getattr(request.app.state, "session_factory_config", None)
+    cached_source = getattr(request.app.state, "session_factory_source", None)
+
+    # Per-request fast path: the same config object needs no model_dump() comparison
+    if cached_factory is not None and cached_source is config:
+        return cached_factory
 
     current_config_dict = _config_to_dict(config)
 
     if cached_factory is not None and cached_config == current_config_dict:
+        request.app.state.session_factory_source = config
         return cached_factory
 
     engine = create_database_engine(config)
     session_factory = create_session_factory(engine)
 
+    request.app.state.db_engine = engine
     request.app.state.session_factory = session_factory
     request.app.state.session_factory_config = current_config_dict
+    request.app.state.session_factory_source = config
 
     return session_factory
 
@@ -4,10 +4,11 @@ from pathlib import Path
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
 
 from app.infrastructure.config import get_settings
-from app.web.assets import reset_manifest_cache
+from app.web.assets import HASHED_ASSETS_DIR, HashedAssetStaticFiles, reset_manifest_cache
 from app.web.routes import api, pages
 
 STATIC_DIR = Path(__file__).resolve().parent / "static"
@@ -30,6 +31,14 @@ def create_application() -> FastAPI:
         allow_headers=["*"],
     )
 
+    # Plotly figure JSON and the SPA bundle compress well; tiny payloads are sent as-is.
+    app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+    app.mount(
+        "/static/frontend/assets",
+        HashedAssetStaticFiles(directory=str(HASHED_ASSETS_DIR), check_dir=False),
+        name="frontend-assets",
+    )
     app.mount("/static", StaticFiles(directory=str(STATIC_DIR), check_dir=False), name="static")
 
     app.include_router(api.router)
@@ -4,13 +4,16 @@ import io
 import json
 import logging
 import math
+import time
+from collections import OrderedDict
+from itertools import groupby
 from html import unescape
 from pathlib import Path
 
 import pandas as pd
-from fastapi import APIRouter, Depends, HTTPException, Request, UploadFile, File, status
-from fastapi.responses import JSONResponse, StreamingResponse
-from sqlalchemy import func
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, UploadFile, File, status
+from fastapi.responses import Response, StreamingResponse
+from sqlalchemy import Float, bindparam, case, func, or_, select, type_coerce
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session
 
@@ -24,6 +27,7 @@ from app.infrastructure.exceptions import (
 )
 from app.infrastructure.models import (
     AssessmentEntryORM,
+    AssessmentSessionORM,
     DimensionORM,
     ExplanationORM,
     RatingScaleORM,
@@ -31,7 +35,7 @@ from app.infrastructure.models import (
     ThemeORM,
     TopicORM,
 )
-from app.infrastructure.repositories import SessionRepo
+from app.infrastructure.repositories import SessionRepo, TopicRepo
 from app.utils.exports import make_json_export_payload, make_xlsx_export_bytes
 from app.utils.seed import initialise_database, seed_database_from_excel
 from app.web.dependencies import get_db_config, get_db_session
@@ -75,6 +79,30 @@ APP_DIR = Path(__file__).resolve().parents[2]
 PROJECT_ROOT = APP_DIR.parent
 DEFAULT_EXCEL_PATH = (APP_DIR / "source_data" / "Maturity_Assessment_Data.xlsx").resolve()
 
+# The session picker polls /sessions on every page load; serve it from app state for a short
+# window and drop the cached list whenever a session is created or the database is switched.
+SESSION_LIST_TTL_SECONDS = 30.0
+# The dimension/theme/topic catalog only changes when the database is seeded or switched.
+TOPIC_CATALOG_TTL_SECONDS = 300.0
+# Plotly figures are a pure function of a session's entries; keep the most recent few.
+DASHBOARD_FIGURES_CACHE_SIZE = 32
+
+PROGRESS_STATES = frozenset({"not_started", "in_progress", "complete"})
+XLSX_UPLOAD_CONTENT_TYPES = frozenset(
+    {
+        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        "application/vnd.ms-excel",
+        "application/octet-stream",
+    }
+)
+
+# An expanding IN parameter keeps one cached compilation whatever the number of topic ids.
+_GUIDANCE_ROWS = (
+    select(ExplanationORM.topic_id, ExplanationORM.level, ExplanationORM.text)
+    .where(ExplanationORM.topic_id.in_(bindparam("topic_ids", expanding=True)))
+    .order_by(ExplanationORM.topic_id, ExplanationORM.level, ExplanationORM.id)
+)
+
 
 def _decode_text(value: str | None) -> str | None:
     if value is None:
@@ -131,20 +159,100 @@ def _merge_config(request: Request, payload: DatabaseInitRequest | None) -> Data
     return DatabaseConfig(**data)
 
 
+def _engine_for(request: Request, config: DatabaseConfig) -> Engine:
+    # Reuse the running engine (and its pool) when the effective config has not changed
+    engine = getattr(request.app.state, "db_engine", None)
+    cached_config = getattr(request.app.state, "session_factory_config", None)
+    if engine is not None and cached_config == _config_to_dict(config):
+        return engine
+    return create_database_engine(config)
+
+
 def _store_runtime_config(
     request: Request,
     config: DatabaseConfig,
     engine: Engine | None = None,
 ) -> None:
     if engine is None:
-        engine = create_database_engine(config)
+        engine = _engine_for(request, config)
     session_factory = create_session_factory(engine)
     config_dict = _config_to_dict(config)
 
+    previous_engine = getattr(request.app.state, "db_engine", None)
+    if previous_engine is not None and previous_engine is not engine:
+        previous_engine.dispose()
+
     request.app.state.db_config = config
     request.app.state.db_engine = engine
     request.app.state.session_factory = session_factory
     request.app.state.session_factory_config = config_dict
+    _invalidate_app_caches(request, reason="database config stored")
+
+
+def _cached_session_list(request: Request, db: Session) -> list[SessionListItem] | None:
+    cached = getattr(request.app.state, "session_list_cache", None)
+    if cached is None:
+        return None
+    bind_url, expires_at, items = cached
+    if bind_url != str(db.get_bind().url) or time.monotonic() >= expires_at:
+        return None
+    return list(items)
+
+
+def _store_session_list(request: Request, db: Session, items: list[SessionListItem]) -> None:
+    expires_at = time.monotonic() + SESSION_LIST_TTL_SECONDS
+    request.app.state.session_list_cache = (str(db.get_bind().url), expires_at, list(items))
+
+
+def _invalidate_session_list(request: Request) -> None:
+    request.app.state.session_list_cache = None
+    logger.debug("Session list cache cleared")
+
+
+def _invalidate_app_caches(request: Request, reason: str) -> None:
+    # Single place that knows every app.state cache; init, seed and settings changes land here.
+    _invalidate_session_list(request)
+    request.app.state.topics_catalog_cache = None
+    request.app.state.dashboard_figures_cache = None
+    request.app.state.last_seed = None
+    logger.debug("Catalog, dashboard figure and seed caches cleared (%s)", reason)
+
+
+def _cached_topics_df(request: Request, db: Session) -> pd.DataFrame:
+    bind_url = str(db.get_bind().url)
+    cached = getattr(request.app.state, "topics_catalog_cache", None)
+    if cached is not None:
+        cached_url, expires_at, topics_df = cached
+        if cached_url == bind_url and time.monotonic() < expires_at:
+            return topics_df
+
+    topics_df = app_api.list_dimensions_with_topics(db)
+    expires_at = time.monotonic() + TOPIC_CATALOG_TTL_SECONDS
+    request.app.state.topics_catalog_cache = (bind_url, expires_at, topics_df)
+    return topics_df
+
+
+def _guidance_by_topic(db: Session, topic_ids: list[int]) -> dict[int, dict[int, list[str]]]:
+    if not topic_ids:
+        return {}
+    # Flat (topic_id, level, text) tuples come back sorted, so each group is built once
+    # instead of two setdefault probes per explanation row.
+    rows = db.execute(_GUIDANCE_ROWS, {"topic_ids": list(topic_ids)}).all()
+    guidance_map: dict[int, dict[int, list[str]]] = {}
+    for topic_id, topic_rows in groupby(rows, key=lambda row: row[0]):
+        guidance_map[topic_id] = {
+            level: [row[2] for row in level_rows]
+            for level, level_rows in groupby(topic_rows, key=lambda row: row[1])
+        }
+    return guidance_map
+
+
+def _resolve_excel_path(raw_path: str) -> Path:
+    # Resolved per request: a cached result would go stale if a symlink or cwd changes.
+    excel_input = Path(raw_path).expanduser()
+    if not excel_input.is_absolute():
+        excel_input = PROJECT_ROOT / excel_input
+    return excel_input.resolve()
 
 
 def _safe_average(value: float | None) -> float | None:
@@ -167,7 +275,9 @@ def update_database_settings(
     request: Request,
 ) -> DatabaseSettings:
     config = _merge_config(request, payload)
-    _store_runtime_config(request, config)
+    # Saving the form without edits keeps the warm engine and every app-state cache intact
+    if _config_to_dict(config) != getattr(request.app.state, "session_factory_config", None):
+        _store_runtime_config(request, config)
     return _config_to_schema(config)
 
 
@@ -178,7 +288,7 @@ def initialise_database_endpoint(
 ) -> DatabaseOperationResponse:
     config = _merge_config(request, payload)
     try:
-        engine = create_database_engine(config)
+        engine = _engine_for(request, config)
         already_exists = initialise_database(engine)
     except Exception as exc:  # pragma: no cover - FastAPI will capture details
         logger.exception("Failed to initialise database")
@@ -203,16 +313,31 @@ def seed_database_endpoint(
     config = _merge_config(request, payload)
     excel_path = DEFAULT_EXCEL_PATH
     if payload and payload.excel_path:
-        excel_input = Path(payload.excel_path).expanduser()
-        if not excel_input.is_absolute():
-            excel_input = PROJECT_ROOT / excel_input
-        excel_path = excel_input.resolve()
+        excel_path = _resolve_excel_path(payload.excel_path)
 
-    if not excel_path.exists():
+    try:
+        excel_stat = excel_path.stat()
+    except FileNotFoundError:
         message = f"Excel file not found at {excel_path}"
         logger.error(message)
         return SeedResponse(status="error", message=message)
 
+    # A repeat click with the same workbook against the same database is a no-op reseed;
+    # skip spawning the seeding subprocess until the file or database settings change.
+    seed_key = (
+        config.get_connection_url(),
+        str(excel_path),
+        excel_stat.st_mtime_ns,
+        excel_stat.st_size,
+    )
+    last_seed = getattr(request.app.state, "last_seed", None)
+    if last_seed is not None and last_seed[0] == seed_key:
+        return SeedResponse(
+            status="ok",
+            message="Seed already applied; workbook unchanged.",
+            command=last_seed[1],
+        )
+
     rc, command, stdout, stderr = seed_database_from_excel(config, excel_path)
     if rc != 0:
         logger.error("Seed from Excel failed: %s", stderr or stdout)
@@ -225,6 +350,7 @@ def seed_database_endpoint(
         )
 
     _store_runtime_config(request, config)
+    request.app.state.last_seed = (seed_key, command)
     return SeedResponse(
         status="ok",
         message="Seed completed.",
@@ -251,8 +377,11 @@ def get_dashboard_data(
     db: Session = Depends(get_db_session),
 ) -> DashboardData:
     try:
-        dimension_results = app_api.compute_dimension_averages(db, session_id=session_id)
+        # Dimension averages are derived from the theme aggregates; compute those only once
         theme_results = app_api.compute_theme_averages(db, session_id=session_id)
+        dimension_results = app_api.compute_dimension_averages(
+            db, session_id=session_id, theme_results=theme_results
+        )
     except SessionNotFoundError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=exc.user_message) from exc
     except ResilienceAssessmentError as exc:
@@ -303,59 +432,62 @@ def get_dashboard_data(
             )
         )
 
-    entries = (
-        db.query(AssessmentEntryORM)
-        .filter(AssessmentEntryORM.session_id == session_id)
-        .all()
-    )
-
-    ratings_map: dict[int, tuple[float, str]] = {}
-    for entry in entries:
-        if entry.current_is_na:
-            continue
-        if entry.computed_score is not None:
-            try:
-                score_value = float(entry.computed_score)
-            except (TypeError, ValueError):
-                continue
-            ratings_map[entry.topic_id] = (score_value, "computed")
-            continue
-        if entry.current_maturity is not None:
-            ratings_map.setdefault(entry.topic_id, (float(entry.current_maturity), "rating"))
-
-    topic_rows = (
-        db.query(
-            TopicORM.id.label("topic_id"),
-            TopicORM.name.label("topic_name"),
-            ThemeORM.id.label("theme_id"),
-            ThemeORM.name.label("theme_name"),
-            DimensionORM.id.label("dimension_id"),
-            DimensionORM.name.label("dimension_name"),
+    # Rated topics only: the join and N/A / unrated filters run in SQL, one tuple per score
+    rated_rows = db.execute(
+        select(
+            TopicORM.id,
+            TopicORM.name,
+            ThemeORM.id,
+            ThemeORM.name,
+            DimensionORM.id,
+            DimensionORM.name,
+            type_coerce(
+                func.coalesce(
+                    AssessmentEntryORM.computed_score, AssessmentEntryORM.current_maturity
+                ),
+                Float,
+            ),
+            case((AssessmentEntryORM.computed_score.isnot(None), "computed"), else_="rating"),
         )
         .join(ThemeORM, TopicORM.theme_id == ThemeORM.id)
         .join(DimensionORM, ThemeORM.dimension_id == DimensionORM.id)
+        .join(
+            AssessmentEntryORM,
+            (AssessmentEntryORM.topic_id == TopicORM.id)
+            & (AssessmentEntryORM.session_id == session_id),
+        )
+        .where(
+            AssessmentEntryORM.current_is_na.is_(False),
+            or_(
+                AssessmentEntryORM.computed_score.isnot(None),
+                AssessmentEntryORM.current_maturity.isnot(None),
+            ),
+        )
         .order_by(DimensionORM.name, ThemeORM.name, TopicORM.name)
-        .all()
-    )
-
-    topic_scores: list[TopicScore] = []
-    for row in topic_rows:
-        rating = ratings_map.get(row.topic_id)
-        if not rating:
-            continue
-        score_value, source = rating
-        topic_scores.append(
-            TopicScore(
-                topic_id=row.topic_id,
-                topic_name=row.topic_name,
-                theme_id=row.theme_id,
-                theme_name=row.theme_name,
-                dimension_id=row.dimension_id,
-                dimension_name=row.dimension_name,
-                score=score_value,
-                source=source,
-            )
+    ).all()
+
+    topic_scores = [
+        TopicScore(
+            topic_id=topic_id,
+            topic_name=topic_name,
+            theme_id=theme_id,
+            theme_name=theme_name,
+            dimension_id=dimension_id,
+            dimension_name=dimension_name,
+            score=score,
+            source=source,
         )
+        for (
+            topic_id,
+            topic_name,
+            theme_id,
+            theme_name,
+            dimension_id,
+            dimension_name,
+            score,
+            source,
+        ) in rated_rows
+    ]
 
     return DashboardData(
         dimensions=dimension_scores,
@@ -364,11 +496,42 @@ def get_dashboard_data(
     )
 
 
+def _entries_fingerprint(db: Session, session_id: int) -> tuple[object, ...]:
+    # Every entry column the figures read, so any change misses the cache. count and
+    # max(updated_at) were not enough: MySQL DATETIME keeps whole seconds only.
+    rows = db.execute(
+        select(
+            AssessmentEntryORM.topic_id,
+            AssessmentEntryORM.current_maturity,
+            AssessmentEntryORM.desired_maturity,
+            AssessmentEntryORM.computed_score,
+            AssessmentEntryORM.current_is_na,
+            AssessmentEntryORM.desired_is_na,
+        )
+        .where(AssessmentEntryORM.session_id == session_id)
+        .order_by(AssessmentEntryORM.topic_id)
+    ).all()
+    return (str(db.get_bind().url), hash(tuple(tuple(row) for row in rows)))
+
+
 @router.get("/sessions/{session_id}/dashboard/figures", response_model=DashboardFiguresResponse)
 def get_dashboard_figures(
     session_id: int,
+    request: Request,
     db: Session = Depends(get_db_session),
 ) -> DashboardFiguresResponse:
+    cache: OrderedDict[int, tuple[tuple[object, ...], dict]] | None = getattr(
+        request.app.state, "dashboard_figures_cache", None
+    )
+    if cache is None:
+        cache = request.app.state.dashboard_figures_cache = OrderedDict()
+
+    fingerprint = _entries_fingerprint(db, session_id)
+    cached = cache.get(session_id)
+    if cached is not None and cached[0] == fingerprint:
+        cache.move_to_end(session_id)
+        return DashboardFiguresResponse(**cached[1])
+
     try:
         payload = app_api.build_dashboard_figures(db, session_id=session_id)
     except SessionNotFoundError as exc:
@@ -376,16 +539,25 @@ def get_dashboard_figures(
     except ResilienceAssessmentError as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=exc.user_message) from exc
 
+    cache[session_id] = (fingerprint, payload)
+    cache.move_to_end(session_id)
+    while len(cache) > DASHBOARD_FIGURES_CACHE_SIZE:
+        cache.popitem(last=False)
     return DashboardFiguresResponse(**payload)
 
 
 @router.get("/dimensions", response_model=list[Dimension])
 def list_dimensions(db: Session = Depends(get_db_session)) -> list[Dimension]:
+    # Plain column rows: read-only view, no ORM identity-map/instrumentation cost
     rows = (
         db.query(
-            DimensionORM,
-            func.count(func.distinct(ThemeORM.id)),
-            func.count(func.distinct(TopicORM.id)),
+            DimensionORM.id,
+            DimensionORM.name,
+            DimensionORM.description,
+            DimensionORM.image_filename,
+            DimensionORM.image_alt,
+            func.count(func.distinct(ThemeORM.id)).label("theme_count"),
+            func.count(func.distinct(TopicORM.id)).label("topic_count"),
         )
         .outerjoin(ThemeORM, ThemeORM.dimension_id == DimensionORM.id)
         .outerjoin(TopicORM, TopicORM.theme_id == ThemeORM.id)
@@ -395,15 +567,15 @@ def list_dimensions(db: Session = Depends(get_db_session)) -> list[Dimension]:
     )
     return [
         Dimension(
-            id=dimension.id,
-            name=dimension.name,
-            description=dimension.description,
-            image_filename=dimension.image_filename,
-            image_alt=dimension.image_alt,
-            theme_count=int(theme_count or 0),
-            topic_count=int(topic_count or 0),
+            id=row.id,
+            name=row.name,
+            description=row.description,
+            image_filename=row.image_filename,
+            image_alt=row.image_alt,
+            theme_count=int(row.theme_count or 0),
+            topic_count=int(row.topic_count or 0),
         )
-        for dimension, theme_count, topic_count in rows
+        for row in rows
     ]
 
 
@@ -481,18 +653,7 @@ def get_dimension_assessment(
         )
         entries_map = {entry.topic_id: entry for entry in entries}
 
-    guidance_map: dict[int, dict[int, list[str]]] = {}
-    if topic_ids:
-        explanations = (
-            db.query(ExplanationORM)
-            .filter(ExplanationORM.topic_id.in_(topic_ids))
-            .order_by(ExplanationORM.topic_id, ExplanationORM.level, ExplanationORM.id)
-            .all()
-        )
-        for explanation in explanations:
-            guidance_map.setdefault(explanation.topic_id, {}).setdefault(explanation.level, []).append(
-                explanation.text
-            )
+    guidance_map = _guidance_by_topic(db, topic_ids)
 
     theme_guidance_map: dict[int, list[ThemeLevelGuidance]] = {theme.id: [] for theme in themes}
     if theme_ids:
@@ -516,8 +677,7 @@ def get_dimension_assessment(
     for topic in topics:
         topics_by_theme.setdefault(topic.theme_id, []).append(topic)
 
-    allowed_states = {"not_started", "in_progress", "complete"}
-    progress_totals = {state: 0 for state in allowed_states}
+    progress_totals = {state: 0 for state in PROGRESS_STATES}
 
     def _parse_evidence(entry: AssessmentEntryORM | None) -> list[str]:
         if entry is None or not entry.evidence_links:
@@ -542,7 +702,7 @@ def get_dimension_assessment(
             evidence = _parse_evidence(entry)
 
             if entry:
-                state = entry.progress_state if entry.progress_state in allowed_states else None
+                state = entry.progress_state if entry.progress_state in PROGRESS_STATES else None
                 if state is None:
                     if entry.current_is_na or entry.current_maturity is not None:
                         if entry.desired_is_na or entry.desired_maturity is not None:
@@ -660,18 +820,7 @@ def get_theme_topics(
         )
         ratings_map = {entry.topic_id: entry for entry in entries}
 
-    guidance_map: dict[int, dict[int, list[str]]] = {}
-    if topic_ids:
-        explanations = (
-            db.query(ExplanationORM)
-            .filter(ExplanationORM.topic_id.in_(topic_ids))
-            .order_by(ExplanationORM.topic_id, ExplanationORM.level, ExplanationORM.id)
-            .all()
-        )
-        for explanation in explanations:
-            guidance_map.setdefault(explanation.topic_id, {}).setdefault(explanation.level, []).append(
-                explanation.text
-            )
+    guidance_map = _guidance_by_topic(db, topic_ids)
 
     rating_scale = [
         RatingScale(level=scale.level, label=scale.label, description=scale.description)
@@ -744,24 +893,49 @@ def get_theme_topics(
     )
 
 
+def _filter_session_list(
+    items: list[SessionListItem], q: str | None, limit: int | None
+) -> list[SessionListItem]:
+    if q and q.strip():
+        needle = q.strip().lower()
+        items = [item for item in items if needle in item.name.lower()]
+    if limit is not None:
+        items = items[:limit]
+    return items
+
+
 @router.get("/sessions", response_model=list[SessionListItem])
-def list_sessions(db: Session = Depends(get_db_session)) -> list[SessionListItem]:
+def list_sessions(
+    request: Request,
+    q: str | None = None,
+    limit: int | None = Query(None, ge=1, le=1000),
+    db: Session = Depends(get_db_session),
+) -> list[SessionListItem]:
+    # Pickers with thousands of sessions pass q/limit; filtering runs on the cached list.
+    cached = _cached_session_list(request, db)
+    if cached is not None:
+        return _filter_session_list(cached, q, limit)
+
     repo = SessionRepo(db)
-    sessions = repo.list_all()
-    return [
-        SessionListItem(
-            id=item.id,
-            name=item.name,
-            assessor=item.assessor,
-            created_at=item.created_at,
-        )
-        for item in sessions
+    rows = repo.list_columns(
+        AssessmentSessionORM.id,
+        AssessmentSessionORM.name,
+        AssessmentSessionORM.assessor,
+        AssessmentSessionORM.created_at,
+        order_by=[AssessmentSessionORM.created_at.desc()],
+    )
+    items = [
+        SessionListItem(id=id_, name=name, assessor=assessor, created_at=created_at)
+        for id_, name, assessor, created_at in rows
     ]
+    _store_session_list(request, db, items)
+    return _filter_session_list(items, q, limit)
 
 
 @router.post("/sessions", response_model=SessionSummary, status_code=status.HTTP_201_CREATED)
 def create_session(
     payload: SessionCreateRequest,
+    request: Request,
     db: Session = Depends(get_db_session),
 ) -> SessionSummary:
     try:
@@ -777,6 +951,8 @@ def create_session(
     except Exception:
         db.rollback()
         raise
+    finally:
+        _invalidate_session_list(request)
 
     return SessionSummary(
         id=session_obj.id,
@@ -790,6 +966,7 @@ def create_session(
 @router.post("/sessions/combine", response_model=SessionSummary)
 def combine_sessions(
     payload: SessionCombineRequest,
+    request: Request,
     db: Session = Depends(get_db_session),
 ) -> SessionSummary:
     if not payload.source_session_ids:
@@ -806,6 +983,8 @@ def combine_sessions(
     except Exception:
         db.rollback()
         raise
+    finally:
+        _invalidate_session_list(request)
 
     return SessionSummary(
         id=master.id,
@@ -849,6 +1028,8 @@ def update_ratings(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Session ID mismatch")
 
     try:
+        # Load all referenced topics up front so per-row Session.get() calls hit the identity map
+        TopicRepo(db).get_many_by_ids(update.topic_id for update in payload.updates)
         for update in payload.updates:
             current_is_na = update.current_is_na
             desired_is_na = update.desired_is_na or current_is_na
@@ -916,16 +1097,28 @@ def update_single_rating(
 
 
 @router.get("/sessions/{session_id}/exports/json")
-def export_session_json(session_id: int, db: Session = Depends(get_db_session)) -> JSONResponse:
-    topics_df, entries_df = app_api.export_session_results(db, session_id=session_id)
-    payload_str = make_json_export_payload(session_id, topics_df, entries_df)
-    payload = json.loads(payload_str)
-    return JSONResponse(content=payload)
+def export_session_json(
+    session_id: int,
+    request: Request,
+    db: Session = Depends(get_db_session),
+) -> Response:
+    topics_df, entries_df = app_api.export_session_results(
+        db, session_id=session_id, topics_df=_cached_topics_df(request, db)
+    )
+    # The payload is already encoded JSON; send it as-is rather than parse and re-dump it
+    payload = make_json_export_payload(session_id, topics_df, entries_df)
+    return Response(content=payload, media_type="application/json")
 
 
 @router.get("/sessions/{session_id}/exports/xlsx")
-def export_session_xlsx(session_id: int, db: Session = Depends(get_db_session)) -> StreamingResponse:
-    topics_df, entries_df = app_api.export_session_results(db, session_id=session_id)
+def export_session_xlsx(
+    session_id: int,
+    request: Request,
+    db: Session = Depends(get_db_session),
+) -> StreamingResponse:
+    topics_df, entries_df = app_api.export_session_results(
+        db, session_id=session_id, topics_df=_cached_topics_df(request, db)
+    )
     xlsx_bytes = make_xlsx_export_bytes(topics_df, entries_df)
     filename = f"assessment_{session_id}.xlsx"
     stream = io.BytesIO(xlsx_bytes)
@@ -943,13 +1136,7 @@ async def import_session_xlsx(
     file: UploadFile = File(...),
     db: Session = Depends(get_db_session),
 ) -> ImportResponse:
-    allowed_types = {
-        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        "application/vnd.ms-excel",
-        "application/octet-stream",
-    }
-
-    if file.content_type not in allowed_types:
+    if file.content_type not in XLSX_UPLOAD_CONTENT_TYPES:
         return ImportResponse(
             status="error",
             message="Unsupported file type. Please upload an Excel .xlsx file.",
@@ -21,8 +21,8 @@ def _base_context(request: Request) -> dict[str, object]:
     return {
         "request": request,
         "app_title": settings.app.title,
-        "scripts": assets.get("scripts", []),
-        "styles": assets.get("styles", []),
+        "scripts": assets.get("scripts", ()),
+        "styles": assets.get("styles", ()),
     }
 
 
@@ -32,6 +32,7 @@ from app.infrastructure.models import (
     ThemeORM,
     TopicORM,
 )
+from app.infrastructure.repositories import TopicRepo
 
 RatingColumn = tuple[int, str, str]
 
@@ -371,6 +372,8 @@ def seed_from_excel(session: Session, excel_path: Path) -> ExcelSeedSource:
 
     dimension_cache: dict[str, int] = {}
     theme_cache: dict[tuple[int, str], int] = {}
+    topic_index: dict[int, dict[str, TopicORM]] = {}
+    topic_repo = TopicRepo(session)
     processed_topics: set[int] = set()
     processed_themes: set[int] = set()
 
@@ -437,15 +440,15 @@ def seed_from_excel(session: Session, excel_path: Path) -> ExcelSeedSource:
                 sync_theme_guidance(session, theme, guidance_levels)
             processed_themes.add(theme.id)
 
-        topic = (
-            session.query(TopicORM)
-            .filter_by(theme_id=theme_id, name=topic_name)
-            .one_or_none()
-        )
+        topics_by_name = topic_index.get(theme_id)
+        if topics_by_name is None:
+            topics_by_name = topic_index[theme_id] = topic_repo.name_index(theme_id)
+        topic = topics_by_name.get(topic_name)
         if topic is None:
             topic = TopicORM(theme_id=theme_id, name=topic_name)
             session.add(topic)
             session.flush()
+            topics_by_name[topic_name] = topic
         details = topic_details.get(topic_name, {})
         topic.description = details.get("description")
         topic.impact = details.get("impact")
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
 import pandas as pd
@@ -291,3 +292,38 @@ def test_import_session_xlsx_updates_entries(tmp_path):
         )
         assert [entry.current_maturity for entry in entries] == [2, 4]
         assert [entry.comment for entry in entries] == ["Adjusted score", "Progress noted"]
+
+
+def test_json_export_writes_null_for_unrated_entries_without_orjson(monkeypatch):
+    from app.utils import exports
+
+    monkeypatch.setattr(exports, "orjson", None)
+    topics_df = pd.DataFrame({"TopicID": [1, 2], "Topic": ["Topic A", "Topic B"]})
+    entries_df = pd.DataFrame(
+        {
+            "TopicID": [1, 2],
+            "CurrentMaturity": [3.0, float("nan")],
+            "ComputedScore": [3.0, float("nan")],
+            "CurrentNA": [False, True],
+            "Comment": ["Rated", None],
+            "UpdatedAt": pd.to_datetime(["2024-01-02 03:04:05", None]),
+            "CreatedAt": pd.to_datetime(["2024-01-01 00:00:00", None], utc=True),
+        }
+    )
+
+    def reject_constant(name: str) -> None:
+        raise AssertionError(f"export contains non-standard JSON constant {name}")
+
+    payload = json.loads(
+        exports.make_json_export_payload(1, topics_df, entries_df),
+        parse_constant=reject_constant,
+    )
+    unrated = payload["entries"][1]
+    assert unrated["CurrentNA"] is True
+    assert unrated["CurrentMaturity"] is None
+    assert unrated["ComputedScore"] is None
+    assert unrated["Comment"] is None
+    assert unrated["UpdatedAt"] is None
+    assert unrated["CreatedAt"] is None
+    assert payload["entries"][0]["UpdatedAt"] == "2024-01-02T03:04:05"
+    assert payload["entries"][0]["CreatedAt"] == "2024-01-01T00:00:00+00:00"
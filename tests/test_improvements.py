@@ -21,6 +21,7 @@ from app.domain.schemas import (
     validate_input,
 )
 from app.domain.services import ScoringService, clamp_rating
+from app.infrastructure import db
 from app.infrastructure.config import DatabaseConfig, get_settings, override_settings
 from app.infrastructure.db import is_database_configured
 from app.infrastructure.exceptions import (
@@ -255,6 +256,26 @@ class TestConfiguration:
         with pytest.raises(ValueError):
             DatabaseConfig(backend="mysql", mysql_host="localhost")
 
+    def test_legacy_engine_cache_disposes_evicted_engines(self, monkeypatch):
+        """Engines pushed out of the legacy URL cache have their pools disposed."""
+        monkeypatch.setattr(db, "_engines", type(db._engines)())
+        monkeypatch.setattr(db, "_ENGINE_CACHE_SIZE", 2)
+
+        first, _ = db.make_engine_and_session("sqlite:///file:a?mode=memory&uri=true")
+        again, _ = db.make_engine_and_session("sqlite:///file:a?mode=memory&uri=true")
+        assert again is first
+
+        with patch.object(first, "dispose") as dispose:
+            db.make_engine_and_session("sqlite:///file:b?mode=memory&uri=true")
+            dispose.assert_not_called()
+            db.make_engine_and_session("sqlite:///file:c?mode=memory&uri=true")
+            dispose.assert_called_once_with()
+
+        assert list(db._engines) == [
+            "sqlite:///file:b?mode=memory&uri=true",
+            "sqlite:///file:c?mode=memory&uri=true",
+        ]
+
 
 class TestRepositoryPatterns:
     """Test improved repository patterns and consistency."""
@@ -354,6 +375,102 @@ class TestQueryOptimization:
         # but the method exists and should work correctly)
         assert isinstance(dimensions, list)
 
+    def test_entry_bulk_upsert_inserts_and_updates(self, test_session):
+        """bulk_upsert validates the batch once and resolves conflicts on (session, topic)."""
+        from app.infrastructure.repositories import (
+            DimensionRepo,
+            EntryRepo,
+            ThemeRepo,
+            TopicRepo,
+        )
+
+        dimension = DimensionRepo(test_session).create(name="Technology")
+        theme = ThemeRepo(test_session).create(dimension_id=dimension.id, name="Resilience")
+        topic = TopicRepo(test_session).create(theme_id=theme.id, name="Backups")
+        session_obj = SessionRepo(test_session).create(name="Bulk")
+
+        repo = EntryRepo(test_session)
+        row = {
+            "session_id": session_obj.id,
+            "topic_id": topic.id,
+            "current_maturity": 2,
+            "desired_maturity": 4,
+        }
+        assert repo.bulk_upsert([row]) == 1
+        entry = repo.get_by_session_and_topic(session_obj.id, topic.id)
+        # A key repeated within one batch is written once, last row winning
+        batch = [{**row, "current_maturity": 1}, {**row, "current_maturity": 3}]
+        assert repo.bulk_upsert(batch) == 1
+
+        assert repo.count() == 1
+        assert entry.current_maturity == 3
+
+    def test_entry_bulk_upsert_portable_fallback_updates_by_key(self, test_session, monkeypatch):
+        """Dialects without a native upsert update the row matching the unique key."""
+        from app.infrastructure.repositories import (
+            DimensionRepo,
+            EntryRepo,
+            ThemeRepo,
+            TopicRepo,
+        )
+
+        dimension = DimensionRepo(test_session).create(name="Technology")
+        theme = ThemeRepo(test_session).create(dimension_id=dimension.id, name="Resilience")
+        topic = TopicRepo(test_session).create(theme_id=theme.id, name="Backups")
+        session_obj = SessionRepo(test_session).create(name="Fallback")
+        monkeypatch.setattr(test_session.get_bind().dialect, "name", "generic")
+
+        repo = EntryRepo(test_session)
+        row = {
+            "session_id": session_obj.id,
+            "topic_id": topic.id,
+            "current_maturity": 2,
+            "desired_maturity": 4,
+        }
+        repo.bulk_upsert([row])
+        repo.bulk_upsert([{**row, "current_maturity": 3}])
+
+        assert repo.count() == 1
+        assert repo.get_by_session_and_topic(session_obj.id, topic.id).current_maturity == 3
+
+    def test_entry_stream_handles_errors_raised_while_fetching(
+        self, test_session, monkeypatch, caplog
+    ):
+        """Errors fetching a later page go through the repository's error handling."""
+        from sqlalchemy.exc import OperationalError
+
+        from app.infrastructure.repositories import EntryRepo
+
+        class FailingResult:
+            def scalars(self):
+                yield "first page"
+                raise OperationalError("FETCH", {}, Exception("connection lost"))
+
+        monkeypatch.setattr(test_session, "execute", lambda *a, **k: FailingResult())
+        entries = EntryRepo(test_session).iter_for_session(1)
+
+        assert next(entries) == "first page"
+        with pytest.raises(OperationalError):
+            next(entries)
+        assert "DB error in iter_entries_for_session" in caplog.text
+
+    def test_topic_create_many_returns_ids_in_order(self, test_session):
+        """create_many inserts the batch at once and keeps ids aligned with the input."""
+        from app.infrastructure.repositories import DimensionRepo, ThemeRepo, TopicRepo
+
+        dimension = DimensionRepo(test_session).create(name="Operations")
+        theme_id = ThemeRepo(test_session).create_many(
+            [{"dimension_id": dimension.id, "name": "Continuity"}]
+        )[0]
+
+        repo = TopicRepo(test_session)
+        names = ["Runbooks", "Failover", "Recovery testing"]
+        ids = repo.create_many({"theme_id": theme_id, "name": name} for name in names)
+
+        assert len(ids) == 3
+        assert [repo.get_by_id(topic_id).name for topic_id in ids] == names
+        assert repo.get_by_name(theme_id, "Failover").id == ids[1]
+
 
 class TestDomainServices:
     """Test domain services improvements."""
@@ -423,6 +540,156 @@ class TestApplicationAPI:
                 test_session, name="", assessor="John Doe"  # Invalid empty name
             )
 
+    @pytest.mark.parametrize("pretty", [False, True])
+    def test_backup_checksum_verifies(self, test_session, tmp_path, pretty):
+        """A freshly written backup passes its own integrity check."""
+        from app.utils.backup import BackupService
+
+        create_assessment_session(test_session, name="Backup Session")
+        test_session.commit()
+
+        service = BackupService(test_session)
+        backup_path = service.create_backup(tmp_path, pretty=pretty)
+        result = service.verify_backup(backup_path)
+
+        assert result["valid"], result["errors"]
+        assert result["metadata"]["checksum"]
+        assert result["statistics"]["sessions"] == 1
+
+    def test_list_backups_reads_metadata_sidecar(self, test_session, tmp_path):
+        """Listing reports each backup once, using its metadata sidecar."""
+        from app.utils.backup import BackupService
+
+        create_assessment_session(test_session, name="Listed Session")
+        test_session.commit()
+
+        service = BackupService(test_session)
+        backup_path = service.create_backup(tmp_path)
+        backups = service.list_backups(tmp_path)
+
+        assert [backup["filename"] for backup in backups] == [backup_path.name]
+        assert backups[0]["total_sessions"] == 1
+
+    def test_backup_with_unavailable_hash_algorithm_fails_verification(
+        self, test_session, tmp_path
+    ):
+        """A checksum that cannot be recomputed here is an error, not a silent pass."""
+        import json
+
+        from app.utils.backup import BackupService
+
+        create_assessment_session(test_session, name="Backup Session")
+        test_session.commit()
+
+        service = BackupService(test_session)
+        backup_path = service.create_backup(tmp_path, compress=False)
+        backup = json.loads(backup_path.read_text(encoding="utf-8"))
+        backup["_metadata"]["hash_algorithm"] = "blake3"
+        backup_path.write_text(json.dumps(backup), encoding="utf-8")
+
+        result = service.verify_backup(backup_path)
+
+        assert not result["valid"]
+        assert "blake3" in result["errors"][0]
+
+    @pytest.mark.parametrize(
+        ("filename", "magic"),
+        [
+            (None, b"\x28\xb5\x2f\xfd"),
+            ("backup.json.zst", b"\x28\xb5\x2f\xfd"),
+            ("backup.json.gz", b"\x1f\x8b"),
+        ],
+    )
+    def test_backup_codec_follows_filename(self, test_session, tmp_path, filename, magic):
+        """zstd is the default codec, but a .gz filename still gets gzip bytes."""
+        pytest.importorskip("zstandard")
+        from app.utils.backup import BackupService
+
+        create_assessment_session(test_session, name="Backup Session")
+        test_session.commit()
+
+        service = BackupService(test_session)
+        backup_path = service.create_backup(tmp_path, filename=filename)
+
+        assert backup_path.read_bytes().startswith(magic)
+        assert service.verify_backup(backup_path)["valid"]
+
+    def test_backup_rejects_codec_that_contradicts_filename(self, test_session, tmp_path):
+        """An explicit codec must agree with a .gz/.zst filename."""
+        from app.utils.backup import BackupService
+
+        service = BackupService(test_session)
+        with pytest.raises(ValidationError):
+            service.create_backup(tmp_path, filename="backup.json.zst", compression="gzip")
+
+    def test_orjson_backup_fails_verification_without_orjson(
+        self, test_session, tmp_path, monkeypatch
+    ):
+        """A backup encoded with orjson is not reported valid where orjson is missing."""
+        from app.utils import backup
+
+        pytest.importorskip("orjson")
+        create_assessment_session(test_session, name="Backup Session")
+        test_session.commit()
+
+        service = backup.BackupService(test_session)
+        backup_path = service.create_backup(tmp_path)
+        monkeypatch.setattr(backup, "orjson", None)
+
+        result = service.verify_backup(backup_path)
+
+        assert not result["valid"]
+        assert "orjson" in result["errors"][0]
+
+    def test_streamed_restore_verifies_against_inline_metadata(self, test_session, tmp_path):
+        """The ijson restore checks the backup's own checksum, not the listing sidecar."""
+        pytest.importorskip("ijson")
+        from app.utils.backup import BackupService, _metadata_sidecar
+
+        create_assessment_session(test_session, name="Streamed Session")
+        test_session.commit()
+
+        service = BackupService(test_session)
+        backup_path = service.create_backup(tmp_path)
+        sidecar = _metadata_sidecar(backup_path)
+        sidecar.write_text('{"checksum": "stale", "hash_algorithm": "sha256"}', encoding="utf-8")
+
+        stats = service.restore_backup(backup_path)
+
+        assert stats["sessions_restored"] == 1
+
+    def test_import_with_repeated_topic_keeps_last_row(self, test_session):
+        """Rows sharing a TopicID import as one entry, the last row winning."""
+        import pandas as pd
+
+        from app.application.api import import_session_results
+        from app.infrastructure.repositories import (
+            DimensionRepo,
+            EntryRepo,
+            ThemeRepo,
+            TopicRepo,
+        )
+
+        # Match the app's session factory, where pending rows are not autoflushed
+        test_session.autoflush = False
+        dimension = DimensionRepo(test_session).create(name="Technology")
+        theme = ThemeRepo(test_session).create(dimension_id=dimension.id, name="Resilience")
+        topic = TopicRepo(test_session).create(theme_id=theme.id, name="Backups")
+        session_obj = create_assessment_session(test_session, name="Import Session")
+
+        dataframe = pd.DataFrame(
+            {
+                "TopicID": [topic.id, topic.id],
+                "CurrentMaturity": [2, 4],
+                "DesiredMaturity": [3, 5],
+                "Comment": ["first", "second"],
+            }
+        )
+        import_session_results(test_session, session_id=session_obj.id, dataframe=dataframe)
+
+        entries = EntryRepo(test_session).list_for_session(session_obj.id)
+        assert [(e.current_maturity, e.comment) for e in entries] == [(4, "second")]
+
 
 class TestIntegration:
     """Integration tests for all improvements working together."""